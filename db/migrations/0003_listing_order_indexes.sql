@@ -0,0 +1,12 @@
+-- Migration 0003: Composite indexes matching the TUI listing order
+-- Section and block lists filter by parent and sort by position, so an
+-- index on (parent, sort key) returns rows already ordered. The older
+-- single-column parent indexes are a prefix of these and are dropped.
+
+CREATE INDEX IF NOT EXISTS idx_sections_document_order
+    ON sections(document_id, order_index, created_at) INCLUDE (title);
+DROP INDEX IF EXISTS idx_sections_document_id;
+
+CREATE INDEX IF NOT EXISTS idx_blocks_section_created
+    ON blocks(section_id, created_at);
+DROP INDEX IF EXISTS idx_blocks_section_id;
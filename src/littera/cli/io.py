@@ -197,6 +197,15 @@ def export_work_markdown(conn) -> str:
     return "\n".join(lines)
 
 
+def _copy_rows(cur, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+    """Bulk-insert rows with COPY: one stream instead of one INSERT per row."""
+    if not rows:
+        return
+    with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
 def import_work_json(conn, data: dict) -> dict:
     """Import JSON data into the current work. Returns summary counts.
 
@@ -275,7 +284,20 @@ def import_work_json(conn, data: dict) -> dict:
                     counts["labels"] += 1
 
     # --- Documents, Sections, Blocks ---
+    # Blocks are the bulk of a work: check their ids for collisions in one
+    # query and COPY them in once their sections exist.
     block_id_map: dict[str, str] = {}  # old_id -> new_id
+    block_rows: list[tuple] = []
+    # Canonical text form on both sides, as Postgres prints id::text
+    wanted = [
+        str(uuid.UUID(blk["id"]))
+        for doc in work_data.get("documents", [])
+        for sec in doc.get("sections", [])
+        for blk in sec.get("blocks", [])
+        if blk.get("id")
+    ]
+    cur.execute("SELECT id::text FROM blocks WHERE id = ANY(%s::uuid[])", (wanted,))
+    taken_block_ids = {r[0] for r in cur.fetchall()}
     for doc in work_data.get("documents", []):
         doc_old_id = doc.get("id")
         doc_new_id = doc_old_id or str(uuid.uuid4())
@@ -304,34 +326,38 @@ def import_work_json(conn, data: dict) -> dict:
 
             for blk in sec.get("blocks", []):
                 blk_old_id = blk.get("id")
-                blk_new_id = blk_old_id or str(uuid.uuid4())
-                cur.execute("SELECT id FROM blocks WHERE id = %s", (blk_new_id,))
-                if cur.fetchone():
+                blk_new_id = str(uuid.UUID(blk_old_id)) if blk_old_id else str(uuid.uuid4())
+                if blk_new_id in taken_block_ids:
                     blk_new_id = str(uuid.uuid4())
-                cur.execute(
-                    "INSERT INTO blocks (id, section_id, block_type, language, source_text) "
-                    "VALUES (%s, %s, %s, %s, %s)",
+                taken_block_ids.add(blk_new_id)
+                block_rows.append(
                     (
                         blk_new_id,
                         sec_new_id,
                         blk.get("block_type", "paragraph"),
                         blk.get("language", "en"),
                         blk.get("source_text", ""),
-                    ),
+                    )
                 )
                 block_id_map[blk_old_id] = blk_new_id
                 counts["blocks"] += 1
 
+    _copy_rows(
+        cur,
+        "blocks",
+        ("id", "section_id", "block_type", "language", "source_text"),
+        block_rows,
+    )
+
     # --- Mentions ---
+    mention_rows: list[tuple] = []
     for m in work_data.get("mentions", []):
         old_block_id = m.get("block_id")
         old_entity_id = m.get("entity_id")
         block_id = block_id_map.get(old_block_id, old_block_id)
         entity_id = entity_id_map.get(old_entity_id, old_entity_id)
         features = m.get("features")
-        cur.execute(
-            "INSERT INTO mentions (id, block_id, entity_id, language, surface_form, features) "
-            "VALUES (%s, %s, %s, %s, %s, %s)",
+        mention_rows.append(
             (
                 str(uuid.uuid4()),
                 block_id,
@@ -339,22 +365,33 @@ def import_work_json(conn, data: dict) -> dict:
                 m.get("language", "en"),
                 m.get("surface_form"),
                 json.dumps(features) if features else None,
-            ),
+            )
         )
         counts["mentions"] += 1
+    _copy_rows(
+        cur,
+        "mentions",
+        ("id", "block_id", "entity_id", "language", "surface_form", "features"),
+        mention_rows,
+    )
 
     # --- Alignments ---
+    alignment_rows: list[tuple] = []
     for a in work_data.get("alignments", []):
         old_src = a.get("source_block_id")
         old_tgt = a.get("target_block_id")
         src_id = block_id_map.get(old_src, old_src)
         tgt_id = block_id_map.get(old_tgt, old_tgt)
-        cur.execute(
-            "INSERT INTO block_alignments (id, source_block_id, target_block_id, alignment_type) "
-            "VALUES (%s, %s, %s, %s)",
-            (str(uuid.uuid4()), src_id, tgt_id, a.get("alignment_type", "translation")),
+        alignment_rows.append(
+            (str(uuid.uuid4()), src_id, tgt_id, a.get("alignment_type", "translation"))
         )
         counts["alignments"] += 1
+    _copy_rows(
+        cur,
+        "block_alignments",
+        ("id", "source_block_id", "target_block_id", "alignment_type"),
+        alignment_rows,
+    )
 
     # --- Reviews ---
     for r in work_data.get("reviews", []):
@@ -2,11 +2,16 @@
 
 All database writes live here. App.py action methods become thin
 orchestrators: guard → call actions.py → dispatch state → render.
+
+`db` is the app's ConnectionPool; each function borrows a connection
+for one transaction, committed when the block exits cleanly.
 """
 
 import json
 import uuid
 
+from littera.linguistics.dispatch import surface_form
+
 
 # =============================================================================
 # Creation
@@ -15,44 +20,52 @@ import uuid
 def create_document(db, work_id: str, title: str) -> str:
     """Create a new document. Returns the new document id."""
     doc_id = str(uuid.uuid4())
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             "INSERT INTO documents (id, work_id, title) VALUES (%s, %s, %s)",
             (doc_id, work_id, title),
         )
-    db.commit()
     return doc_id
 
 
-def create_section(db, document_id: str, title: str) -> str:
-    """Create a new section in a document. Returns the new section id."""
+def create_section(db, document_id: str, title: str, order_index: int | None = None) -> str:
+    """Create a new section in a document. Returns the new section id.
+
+    Pass order_index when the caller already knows the next position;
+    otherwise it is computed from the existing sections.
+    """
     section_id = str(uuid.uuid4())
-    with db.cursor() as cur:
-        cur.execute(
-            "INSERT INTO sections (id, document_id, title, order_index) "
-            "VALUES (%s, %s, %s, COALESCE((SELECT MAX(order_index)+1 FROM sections WHERE document_id = %s), 1))",
-            (section_id, document_id, title, document_id),
-        )
-    db.commit()
+    with db.connection() as conn, conn.cursor() as cur:
+        if order_index is not None:
+            cur.execute(
+                "INSERT INTO sections (id, document_id, title, order_index) "
+                "VALUES (%s, %s, %s, %s)",
+                (section_id, document_id, title, order_index),
+            )
+        else:
+            cur.execute(
+                "INSERT INTO sections (id, document_id, title, order_index) "
+                "VALUES (%s, %s, %s, COALESCE((SELECT MAX(order_index)+1 FROM sections WHERE document_id = %s), 1))",
+                (section_id, document_id, title, document_id),
+            )
     return section_id
 
 
 def create_block(db, section_id: str) -> str:
     """Create a new block in a section. Returns the new block id."""
     block_id = str(uuid.uuid4())
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             "INSERT INTO blocks (id, section_id, block_type, language, source_text) "
             "VALUES (%s, %s, 'paragraph', 'en', '(new block)')",
             (block_id, section_id),
         )
-    db.commit()
     return block_id
 
 
 def create_entity(db, entity_type: str, name: str) -> str | None:
     """Create a new entity. Returns the entity id, or None on failure."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             "INSERT INTO entities (entity_type, canonical_label) VALUES (%s, %s) RETURNING id",
             (entity_type, name),
@@ -60,7 +73,6 @@ def create_entity(db, entity_type: str, name: str) -> str | None:
         row = cur.fetchone()
     if row is None:
         return None
-    db.commit()
     return str(row[0])
 
 
@@ -72,25 +84,23 @@ def create_review(db, work_id: str, description: str, severity: str = "medium",
                   scope: str | None = None, issue_type: str | None = None) -> str:
     """Create a new review. Returns the review id."""
     review_id = str(uuid.uuid4())
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute("""
             INSERT INTO reviews (id, work_id, description, severity, scope, issue_type)
             VALUES (%s, %s, %s, %s, %s, %s)
         """, (review_id, work_id, description, severity, scope, issue_type))
-    db.commit()
     return review_id
 
 
 def delete_review(db, review_id: str) -> None:
     """Delete a review by its id."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute("DELETE FROM reviews WHERE id = %s", (review_id,))
-    db.commit()
 
 
 def delete_item(db, kind: str, item_id: str) -> None:
     """Delete a document, section, or block by kind and id."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         if kind == "document":
             cur.execute("DELETE FROM documents WHERE id = %s", (item_id,))
         elif kind == "section":
@@ -99,14 +109,12 @@ def delete_item(db, kind: str, item_id: str) -> None:
             cur.execute("DELETE FROM blocks WHERE id = %s", (item_id,))
         else:
             return
-    db.commit()
 
 
 def delete_entity(db, entity_id: str) -> None:
     """Delete an entity by id. Cascades to mentions and labels via FK."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute("DELETE FROM entities WHERE id = %s", (entity_id,))
-    db.commit()
 
 
 # =============================================================================
@@ -121,13 +129,27 @@ def move_item(db, kind: str, item_id: str, new_position: int) -> bool:
 
     Returns True if the move was applied, False if position is out of range.
     """
-    with db.cursor() as cur:
+    return _reorder(db, kind, item_id, lambda ids: new_position)
+
+
+def shift_item(db, kind: str, item_id: str, offset: int) -> bool:
+    """Move a document or section `offset` places up (-1) or down (+1).
+
+    The current position is read in the same transaction as the move, so
+    repeated shifts stack instead of racing on a stale list.
+    """
+    return _reorder(db, kind, item_id, lambda ids: ids.index(str(item_id)) + 1 + offset)
+
+
+def _reorder(db, kind: str, item_id: str, position_of) -> bool:
+    """Rewrite sibling order_index with item_id at position_of(sibling_ids)."""
+    with db.connection() as conn, conn.cursor() as cur:
         if kind == "document":
-            # Get siblings: all documents in the same work
+            # Get siblings: all documents in the same work (locked until commit)
             cur.execute(
                 "SELECT id FROM documents "
                 "WHERE work_id = (SELECT work_id FROM documents WHERE id = %s) "
-                "ORDER BY order_index NULLS LAST, created_at",
+                "ORDER BY order_index NULLS LAST, created_at FOR UPDATE",
                 (item_id,),
             )
         elif kind == "section":
@@ -135,14 +157,17 @@ def move_item(db, kind: str, item_id: str, new_position: int) -> bool:
             cur.execute(
                 "SELECT id FROM sections "
                 "WHERE document_id = (SELECT document_id FROM sections WHERE id = %s) "
-                "ORDER BY order_index NULLS LAST, created_at",
+                "ORDER BY order_index NULLS LAST, created_at FOR UPDATE",
                 (item_id,),
             )
         else:
             return False
 
         ids = [str(r[0]) for r in cur.fetchall()]
+        if str(item_id) not in ids:
+            return False
 
+        new_position = position_of(ids)
         if new_position < 1 or new_position > len(ids):
             return False
 
@@ -157,7 +182,6 @@ def move_item(db, kind: str, item_id: str, new_position: int) -> bool:
                 f"UPDATE {table} SET order_index = %s WHERE id = %s",
                 (idx, row_id),
             )
-    db.commit()
     return True
 
 
@@ -167,21 +191,23 @@ def move_item(db, kind: str, item_id: str, new_position: int) -> bool:
 
 def update_title(db, kind: str, item_id: str, title: str) -> None:
     """Update title for a document or section."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         if kind == "document":
-            cur.execute("UPDATE documents SET title = %s WHERE id = %s", (title, item_id))
+            cur.execute(
+                "UPDATE documents SET title = %s WHERE id = %s", (title, item_id), prepare=True
+            )
         elif kind == "section":
-            cur.execute("UPDATE sections SET title = %s WHERE id = %s", (title, item_id))
+            cur.execute(
+                "UPDATE sections SET title = %s WHERE id = %s", (title, item_id), prepare=True
+            )
         else:
             return
-    db.commit()
 
 
 def set_block_language(db, block_id: str, language: str) -> None:
     """Update a block's language."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute("UPDATE blocks SET language = %s WHERE id = %s", (language, block_id))
-    db.commit()
 
 
 # =============================================================================
@@ -193,44 +219,42 @@ def link_entity(db, block_id: str, entity_name: str) -> tuple[str, bool]:
 
     Returns (entity_id, created_new).
     """
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
+        # One round-trip: reuse or create the entity, then insert the
+        # mention unless it already exists (idx_mentions_unique).
         cur.execute(
-            "SELECT id FROM entities WHERE canonical_label = %s", (entity_name,)
+            """
+            WITH found AS (
+                SELECT id FROM entities WHERE canonical_label = %(name)s LIMIT 1
+            ), created AS (
+                INSERT INTO entities (entity_type, canonical_label)
+                SELECT 'concept', %(name)s
+                WHERE NOT EXISTS (SELECT 1 FROM found)
+                RETURNING id
+            ), entity AS (
+                SELECT id, false AS created_new FROM found
+                UNION ALL
+                SELECT id, true FROM created
+            ), block AS (
+                SELECT id, language FROM blocks WHERE id = %(block_id)s
+            ), linked AS (
+                INSERT INTO mentions (block_id, entity_id, language)
+                SELECT block.id, entity.id, block.language FROM block, entity
+                ON CONFLICT DO NOTHING
+            )
+            SELECT entity.id, entity.created_new, EXISTS (SELECT 1 FROM block)
+            FROM entity
+            """,
+            {"name": entity_name, "block_id": block_id},
+            prepare=True,
         )
         row = cur.fetchone()
-
-        created_new = False
-        if row:
-            entity_id = str(row[0])
-        else:
-            cur.execute(
-                "INSERT INTO entities (entity_type, canonical_label) VALUES ('concept', %s) RETURNING id",
-                (entity_name,),
-            )
-            new_row = cur.fetchone()
-            if new_row is None:
-                raise RuntimeError(f"Failed to create entity '{entity_name}'")
-            entity_id = str(new_row[0])
-            created_new = True
-
-        # Get block language (required by mentions schema)
-        cur.execute("SELECT language FROM blocks WHERE id = %s", (block_id,))
-        lang_row = cur.fetchone()
-        if lang_row is None:
+        if row is None:
+            raise RuntimeError(f"Failed to create entity '{entity_name}'")
+        entity_id, created_new, block_found = str(row[0]), row[1], row[2]
+        if not block_found:
+            # Raising inside the block rolls back any entity created above
             raise LookupError(f"Block {block_id} not found")
-        language = lang_row[0]
-
-        # Insert mention if not already linked
-        cur.execute(
-            "SELECT 1 FROM mentions WHERE block_id = %s AND entity_id = %s AND language = %s",
-            (block_id, entity_id, language),
-        )
-        if cur.fetchone() is None:
-            cur.execute(
-                "INSERT INTO mentions (block_id, entity_id, language) VALUES (%s, %s, %s)",
-                (block_id, entity_id, language),
-            )
-    db.commit()
     return entity_id, created_new
 
 
@@ -240,7 +264,7 @@ def link_entity(db, block_id: str, entity_name: str) -> tuple[str, bool]:
 
 def save_entity_note(db, entity_id: str, work_id: str, text: str) -> None:
     """Save (upsert) an entity's work-scoped note."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO entity_work_metadata (entity_id, work_id, metadata)
@@ -250,17 +274,15 @@ def save_entity_note(db, entity_id: str, work_id: str, text: str) -> None:
             """,
             (entity_id, work_id, json.dumps({"note": text})),
         )
-    db.commit()
 
 
 def save_block_text(db, block_id: str, text: str) -> None:
     """Save block source text."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             "UPDATE blocks SET source_text = %s WHERE id = %s",
             (text, block_id),
         )
-    db.commit()
 
 
 # =============================================================================
@@ -270,7 +292,7 @@ def save_block_text(db, block_id: str, text: str) -> None:
 def add_entity_label(db, entity_id: str, language: str, base_form: str) -> None:
     """Add or update a label for an entity (one per language)."""
     label_id = str(uuid.uuid4())
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO entity_labels (id, entity_id, language, base_form)
@@ -280,18 +302,16 @@ def add_entity_label(db, entity_id: str, language: str, base_form: str) -> None:
             """,
             (label_id, entity_id, language, base_form),
         )
-    db.commit()
 
 
 def delete_entity_label(db, entity_id: str, language: str) -> bool:
     """Delete a label by entity and language. Returns True if deleted."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             "DELETE FROM entity_labels WHERE entity_id = %s AND language = %s",
             (entity_id, language),
         )
         deleted = cur.rowcount > 0
-    db.commit()
     return deleted
 
 
@@ -301,44 +321,86 @@ def delete_entity_label(db, entity_id: str, language: str) -> bool:
 
 def set_entity_property(db, entity_id: str, key: str, value: str) -> None:
     """Set a property on an entity (merged into existing properties JSONB)."""
-    with db.cursor() as cur:
-        cur.execute("SELECT properties FROM entities WHERE id = %s", (entity_id,))
-        row = cur.fetchone()
-        props = row[0] if row and row[0] else {}
-        props[key] = value
+    # Merged in SQL so overlapping writes can't drop each other's keys
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
-            "UPDATE entities SET properties = %s WHERE id = %s",
-            (json.dumps(props), entity_id),
+            "UPDATE entities "
+            "SET properties = COALESCE(properties, '{}'::jsonb) || jsonb_build_object(%s::text, %s::text) "
+            "WHERE id = %s",
+            (key, value, entity_id),
         )
-    db.commit()
 
 
 def delete_entity_property(db, entity_id: str, key: str) -> bool:
     """Delete a property from an entity. Returns True if deleted."""
-    with db.cursor() as cur:
-        cur.execute("SELECT properties FROM entities WHERE id = %s", (entity_id,))
-        row = cur.fetchone()
-        props = row[0] if row and row[0] else {}
-        if key not in props:
-            return False
-        del props[key]
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
-            "UPDATE entities SET properties = %s WHERE id = %s",
-            (json.dumps(props) if props else None, entity_id),
+            "UPDATE entities SET properties = NULLIF(properties - %s::text, '{}'::jsonb) "
+            "WHERE id = %s AND properties ? %s::text",
+            (key, entity_id, key),
         )
-    db.commit()
-    return True
+        deleted = cur.rowcount > 0
+    return deleted
 
 
 # =============================================================================
-# Mention deletion
+# Mentions
 # =============================================================================
 
+def set_surface_form(db, mention_id: str, language: str, features: dict) -> str | None:
+    """Inflect the mention's entity label for features and store the result.
+
+    Returns the surface form, or None if the mention does not exist.
+    """
+    with db.connection() as conn, conn.cursor() as cur:
+        # Get entity_id for this mention
+        cur.execute(
+            "SELECT entity_id FROM mentions WHERE id = %s",
+            (mention_id,),
+        )
+        row = cur.fetchone()
+        if row is None:
+            return None
+        entity_id = row[0]
+
+        # Look up base_form from entity_labels for this language
+        cur.execute(
+            "SELECT base_form FROM entity_labels WHERE entity_id = %s AND language = %s",
+            (entity_id, language),
+        )
+        row = cur.fetchone()
+        if row:
+            base_form = row[0]
+        else:
+            # Fall back to canonical_label
+            cur.execute(
+                "SELECT canonical_label FROM entities WHERE id = %s",
+                (entity_id,),
+            )
+            row = cur.fetchone()
+            base_form = row[0] if row else "?"
+
+        # Fetch entity properties
+        cur.execute(
+            "SELECT properties FROM entities WHERE id = %s",
+            (entity_id,),
+        )
+        row = cur.fetchone()
+        properties = row[0] if row and row[0] else None
+
+        result = surface_form(language, base_form, features or None, properties)
+
+        cur.execute(
+            "UPDATE mentions SET surface_form = %s, features = %s WHERE id = %s",
+            (result, json.dumps(features) if features else None, mention_id),
+        )
+    return result
+
+
 def delete_mention(db, mention_id: str) -> None:
     """Delete a mention by its id."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute("DELETE FROM mentions WHERE id = %s", (mention_id,))
-    db.commit()
 
 
 # =============================================================================
@@ -349,7 +411,7 @@ def create_alignment(db, source_block_id: str, target_block_id: str,
                      alignment_type: str = "translation") -> str | None:
     """Create a block alignment. Returns alignment id, or None if duplicate."""
     alignment_id = str(uuid.uuid4())
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             """SELECT 1 FROM block_alignments
                WHERE (source_block_id = %s AND target_block_id = %s)
@@ -363,12 +425,10 @@ def create_alignment(db, source_block_id: str, target_block_id: str,
             "VALUES (%s, %s, %s, %s)",
             (alignment_id, source_block_id, target_block_id, alignment_type),
         )
-    db.commit()
     return alignment_id
 
 
 def delete_alignment(db, alignment_id: str) -> None:
     """Delete a block alignment by its id."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute("DELETE FROM block_alignments WHERE id = %s", (alignment_id,))
-    db.commit()
@@ -9,28 +9,36 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from pathlib import Path
+import asyncio
 import logging
+import threading
+import time
 
+import psycopg
+from psycopg_pool import ConnectionPool
 import yaml
 
 from textual.app import App, ComposeResult
 from textual.css.query import NoMatches
-from textual.widgets import Footer, Header, ListView
+from textual.message import Message
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.widgets import Footer, Header, ListView, Static
 from textual.containers import Horizontal
 
 from littera.tui.state import (
     AppState,
     PathElement,
+    Selection,
     EditTarget,
-    GotoOutline,
-    GotoEntities,
-    GotoAlignments,
-    GotoReviews,
+    GotoView,
     ExitEditor,
     OutlinePush,
     OutlinePop,
     OutlineSelect,
+    OutlineShowMore,
     EntitiesSelect,
     EntitiesClearSelection,
     AlignmentsSelect,
@@ -39,6 +47,7 @@ from littera.tui.state import (
     ReviewsClearSelection,
     ClearSelection,
     StartEdit,
+    SaveAndExit,
 )
 
 from littera.tui.views.alignments import AlignmentsView
@@ -59,9 +68,29 @@ from littera.db.bootstrap import (
     reinit_cluster,
     ensure_database,
 )
+from littera.db.migrate import migrate
 from littera.db.workdb import postgres_config_from_work
 from littera.db.embedded_pg import EmbeddedPostgresManager
 
+# Seconds to wait for highlight moves to settle before rendering
+RENDER_DEBOUNCE = 0.016
+
+# Seconds between partial updates of a running gap report
+GAPS_PROGRESS = 0.1
+
+# List item id prefixes (see views) and the outline kinds they stand for
+_WIDGET_PREFIXES = frozenset(("doc", "sec", "blk", "ent", "aln", "rev"))
+_PREFIX_KINDS = {"doc": "document", "sec": "section", "blk": "block"}
+_NAV_LEVEL_KINDS = {"documents": "document", "sections": "section", "blocks": "block"}
+
+# Views whose data is read from DB before each render
+_VIEW_LOADERS = {
+    "outline": queries.load_outline,
+    "entities": queries.load_entities,
+    "alignments": queries.load_alignments,
+    "reviews": queries.load_reviews,
+}
+
 
 class LitteraApp(App):
     CSS_PATH = "tui.css"
@@ -94,18 +123,49 @@ class LitteraApp(App):
         ("ctrl+down", "move_down", "Move Down"),
     ]
 
+    class DatabaseReady(Message):
+        """Posted by the startup worker once Postgres is up and the pool open."""
+
+        def __init__(self, pool: ConnectionPool) -> None:
+            super().__init__()
+            self.pool = pool
+
+    class DatabaseCorrupted(Message):
+        """Posted by the startup worker when Postgres refuses to start."""
+
+        def __init__(self, pg_cfg, error: WalCorruptionError, can_recover: bool) -> None:
+            super().__init__()
+            self.pg_cfg = pg_cfg
+            self.error = error
+            self.can_recover = can_recover
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.state: AppState | None = None
         self.views = {}
         self._pg_cfg = None
         self._pg_started_here = False
+        # Shared with the startup worker: on_unmount sets _quitting and tears
+        # down whatever startup got to; the worker tears down anything it
+        # brings up after that.
+        self._startup_lock = threading.Lock()
+        self._startup_pool: ConnectionPool | None = None
+        self._quitting = False
         self._work_cfg: dict = {}
         self._suppress_editor_change_events = False
+        self._mounted_view: str | None = None
+        self._render_timer: Timer | None = None
+        self._rendered_signature: tuple | None = None
+        self._editor: Widget | None = None
+        self._editor_attr = "text"
+        # DB calls run on worker threads; this keeps them one at a time
+        self._db_lock = threading.Lock()
+        self._saving = False
 
     def compose(self) -> ComposeResult:
         yield Header()
-        yield Horizontal(id="main")
+        # Replaced by the first view once the database is up
+        yield Horizontal(Static("Starting database...", id="splash"), id="main")
         yield Footer()
 
     def on_mount(self) -> None:
@@ -121,27 +181,85 @@ class LitteraApp(App):
 
         self._work_cfg = self._load_cfg()
 
+        # Fetching binaries and starting Postgres can take seconds; do it
+        # off the UI thread so the splash shows meanwhile.
+        self.run_worker(
+            lambda: self._start_database(littera_dir), thread=True, group="startup"
+        )
+
+    def _start_database(self, littera_dir: Path) -> None:
+        """Worker thread: bring up Postgres, then finish init on the UI thread.
+
+        Results are posted as messages rather than via call_from_thread,
+        which would block forever if the app quit in the meantime.
+        """
         EmbeddedPostgresManager(littera_dir).ensure()
 
         pg_cfg = postgres_config_from_work(littera_dir, self._work_cfg)
         self._pg_cfg = pg_cfg
 
         try:
-            self._pg_started_here = start_postgres(pg_cfg)
+            started = start_postgres(pg_cfg)
         except WalCorruptionError as e:
             can_recover = find_pg_resetwal(pg_cfg) is not None
-            self._handle_wal_corruption(pg_cfg, e, can_recover)
-            return
-
-        self._finish_init(pg_cfg, self._work_cfg)
+            self.post_message(self.DatabaseCorrupted(pg_cfg, e, can_recover))
+            return
+
+        with self._startup_lock:
+            self._pg_started_here = started
+            closing = self._quitting
+        if closing:
+            # Quit while starting: on_unmount didn't know about this server
+            if started:
+                stop_postgres(pg_cfg)
+            return
+
+        pool = self._open_pool(pg_cfg)
+        with self._startup_lock:
+            closing = self._quitting
+            if not closing:
+                self._startup_pool = pool
+        if closing:
+            # on_unmount already stopped the server; only the pool is ours
+            pool.close()
+            return
+
+        self.post_message(self.DatabaseReady(pool))
+
+    def on_littera_app_database_ready(self, message: DatabaseReady) -> None:
+        if not self._quitting:
+            self._finish_init(message.pool, self._work_cfg)
+
+    def on_littera_app_database_corrupted(self, message: DatabaseCorrupted) -> None:
+        if not self._quitting:
+            self._handle_wal_corruption(message.pg_cfg, message.error, message.can_recover)
+
+    @staticmethod
+    def _open_pool(pg_cfg) -> ConnectionPool:
+        # Actions and queries borrow a connection per call; the pool keeps
+        # a couple warm so they don't pay a fresh connect each time.
+        # The refresh queries repeat on every highlight, so let psycopg
+        # prepare them on the second run instead of the default fifth.
+        pool = ConnectionPool(
+            kwargs={
+                "dbname": pg_cfg.db_name,
+                "port": pg_cfg.port,
+                "prepare_threshold": 2,
+            },
+            min_size=2,
+            max_size=4,
+            open=True,
+        )
+        pool.wait()
+        return pool
 
-    def _finish_init(self, pg_cfg, cfg: dict) -> None:
+    def _finish_init(self, pool: ConnectionPool, cfg: dict) -> None:
         """Complete TUI initialization after PG is running."""
-        import psycopg
-
-        conn = psycopg.connect(dbname=pg_cfg.db_name, port=pg_cfg.port)
-
-        self.state = AppState(work=cfg, db=conn)
+        self.state = AppState(
+            work=cfg,
+            work_id=cfg.get("work", {}).get("id"),
+            db=pool,
+        )
         self.views = {
             "outline": OutlineView(),
             "entities": EntitiesView(),
@@ -176,7 +294,7 @@ class LitteraApp(App):
         try:
             reset_wal(pg_cfg)
             self._pg_started_here = start_postgres(pg_cfg)
-            self._finish_init(pg_cfg, self._work_cfg)
+            self._finish_init(self._open_pool(pg_cfg), self._work_cfg)
         except Exception as e:
             logging.exception("WAL recovery failed")
             self.notify(f"Recovery failed: {e}", severity="error")
@@ -189,27 +307,26 @@ class LitteraApp(App):
             self._pg_started_here = start_postgres(pg_cfg)
             ensure_database(pg_cfg)
 
-            from littera.db.migrate import migrate
-            import psycopg
-
             conn = psycopg.connect(dbname=pg_cfg.db_name, port=pg_cfg.port)
             migrate(conn)
             conn.close()
 
-            self._finish_init(pg_cfg, self._work_cfg)
+            self._finish_init(self._open_pool(pg_cfg), self._work_cfg)
         except Exception as e:
             logging.exception("Re-initialization failed")
             self.notify(f"Re-initialization failed: {e}", severity="error")
             self.exit()
 
     def on_unmount(self) -> None:
-        if self.state is not None:
-            self.state.db.close()
+        with self._startup_lock:
+            self._quitting = True
+            pool = self.state.db if self.state is not None else self._startup_pool
+            started = self._pg_started_here
 
-        if (
-            getattr(self, "_pg_started_here", False)
-            and getattr(self, "_pg_cfg", None) is not None
-        ):
+        if pool is not None:
+            pool.close()
+
+        if started and self._pg_cfg is not None:
             stop_postgres(self._pg_cfg)
 
     # =====================
@@ -219,33 +336,25 @@ class LitteraApp(App):
     def action_outline(self) -> None:
         if self.state is None:
             return
-        self.state.dispatch(GotoOutline())
-        self.state.dispatch(ExitEditor())
-        self._clear_undo_redo()
+        self.state.dispatch(GotoView("outline"))
         self._render_view()
 
     def action_entities(self) -> None:
         if self.state is None:
             return
-        self.state.dispatch(GotoEntities())
-        self.state.dispatch(ExitEditor())
-        self._clear_undo_redo()
+        self.state.dispatch(GotoView("entities"))
         self._render_view()
 
     def action_alignments(self) -> None:
         if self.state is None:
             return
-        self.state.dispatch(GotoAlignments())
-        self.state.dispatch(ExitEditor())
-        self._clear_undo_redo()
+        self.state.dispatch(GotoView("alignments"))
         self._render_view()
 
     def action_reviews(self) -> None:
         if self.state is None:
             return
-        self.state.dispatch(GotoReviews())
-        self.state.dispatch(ExitEditor())
-        self._clear_undo_redo()
+        self.state.dispatch(GotoView("reviews"))
         self._render_view()
 
     # =====================
@@ -265,11 +374,23 @@ class LitteraApp(App):
         sel = self.state.entity_selection
 
         if sel.kind in ("document", "section"):
-            title = queries.fetch_item_title(self.state.db, sel.kind, sel.id)
-            self.state.dispatch(
-                OutlinePush(PathElement(kind=sel.kind, id=sel.id, title=title))
-            )
-            self._render_view()
+            kind, item_id = sel.kind, sel.id
+
+            def push(title: str) -> None:
+                self.state.cache.titles[kind, item_id] = title
+                self.state.dispatch(
+                    OutlinePush(PathElement(kind=kind, id=item_id, title=title))
+                )
+
+            title = self.state.cache.titles.get((kind, item_id))
+            if title is not None:
+                push(title)
+                self._render_view()
+            else:
+                self._db(
+                    queries.fetch_item_title, self.state.db, kind, item_id,
+                    on_done=push, read_only=True,
+                )
 
         elif sel.kind == "block":
             self.action_edit_block()
@@ -335,22 +456,9 @@ class LitteraApp(App):
         if not sel.id or sel.kind not in ("document", "section"):
             return
 
-        # Find current position among siblings
-        items = self.state.outline.items
-        current_idx = None
-        for i, item in enumerate(items):
-            if item.id == sel.id:
-                current_idx = i
-                break
-        if current_idx is None:
-            return
-
-        new_position = current_idx + 1 + direction  # 1-based
-        if new_position < 1 or new_position > len(items):
-            return
-
-        actions.move_item(self.state.db, sel.kind, sel.id, new_position)
-        self._render_view()
+        # The target position is worked out inside the write, against the
+        # committed order, so quick repeated moves don't act on a stale list
+        self._db(actions.shift_item, self.state.db, sel.kind, sel.id, direction)
 
     # =====================
     # Creation
@@ -431,22 +539,23 @@ class LitteraApp(App):
     def _create_entity(self, entity_type: str, name: str) -> None:
         if self.state is None:
             return
-        entity_id = actions.create_entity(self.state.db, entity_type, name)
-        if entity_id is None:
-            return
-        self.state.dispatch(EntitiesSelect(entity_id))
-        self._render_view()
+
+        def select(entity_id: str | None) -> None:
+            if entity_id is not None:
+                self.state.dispatch(EntitiesSelect(entity_id))
+
+        self._db(actions.create_entity, self.state.db, entity_type, name, on_done=select)
 
     @safe_action
     def _create_document(self, title: str) -> None:
-        if self.state is None or self.state.work is None:
-            return
-        work_id = self.state.work.get("work", {}).get("id")
-        if work_id is None:
+        if self.state is None or self.state.work_id is None:
             return
-        doc_id = actions.create_document(self.state.db, work_id, title)
-        self.state.dispatch(OutlineSelect(kind="document", item_id=doc_id))
-        self._render_view()
+        self._db(
+            actions.create_document, self.state.db, self.state.work_id, title,
+            on_done=lambda doc_id: self.state.dispatch(
+                OutlineSelect(kind="document", item_id=doc_id)
+            ),
+        )
 
     @safe_action
     def _create_section(self, title: str) -> None:
@@ -455,9 +564,17 @@ class LitteraApp(App):
         doc = self.state.current_document
         if not doc:
             return
-        section_id = actions.create_section(self.state.db, doc.id, title)
-        self.state.dispatch(OutlineSelect(kind="section", item_id=section_id))
-        self._render_view()
+        # Reserve the next position now so back-to-back adds don't collide
+        orders = self.state.cache.section_orders
+        order_index = None
+        if doc.id in orders:
+            order_index = orders[doc.id] = orders[doc.id] + 1
+        self._db(
+            actions.create_section, self.state.db, doc.id, title, order_index,
+            on_done=lambda section_id: self.state.dispatch(
+                OutlineSelect(kind="section", item_id=section_id)
+            ),
+        )
 
     @safe_action
     def _create_block(self) -> None:
@@ -466,9 +583,12 @@ class LitteraApp(App):
         section = self.state.current_section
         if not section:
             return
-        block_id = actions.create_block(self.state.db, section.id)
-        self.state.dispatch(OutlineSelect(kind="block", item_id=block_id))
-        self._render_view()
+        self._db(
+            actions.create_block, self.state.db, section.id,
+            on_done=lambda block_id: self.state.dispatch(
+                OutlineSelect(kind="block", item_id=block_id)
+            ),
+        )
 
     @safe_action
     def _prompt_add_review(self) -> None:
@@ -499,14 +619,12 @@ class LitteraApp(App):
 
     @safe_action
     def _create_review(self, description: str, severity: str) -> None:
-        if self.state is None or self.state.work is None:
+        if self.state is None or self.state.work_id is None:
             return
-        work_id = self.state.work.get("work", {}).get("id")
-        if work_id is None:
-            return
-        review_id = actions.create_review(self.state.db, work_id, description, severity)
-        self.state.dispatch(ReviewsSelect(review_id))
-        self._render_view()
+        self._db(
+            actions.create_review, self.state.db, self.state.work_id, description, severity,
+            on_done=lambda review_id: self.state.dispatch(ReviewsSelect(review_id)),
+        )
 
     @safe_action
     def _delete_review(self) -> None:
@@ -522,9 +640,10 @@ class LitteraApp(App):
         async def on_confirm(confirmed: bool) -> None:
             if not confirmed:
                 return
-            actions.delete_review(self.state.db, review_id)
-            self.state.dispatch(ClearSelection())
-            self._render_view()
+            self._db(
+                actions.delete_review, self.state.db, review_id,
+                on_done=lambda _: self.state.dispatch(ClearSelection()),
+            )
 
         self.push_screen(
             ConfirmDialog("Delete Review?", "This cannot be undone."),
@@ -543,7 +662,10 @@ class LitteraApp(App):
         if sel.kind not in ("document", "section") or not sel.id:
             return
 
-        current_title = queries.fetch_item_title(self.state.db, sel.kind, sel.id)
+        current_title = self.state.cache.titles.get((sel.kind, sel.id))
+        if current_title is None:
+            current_title = queries.fetch_item_title(self.state.db, sel.kind, sel.id)
+            self.state.cache.titles[sel.kind, sel.id] = current_title
         kind_label = sel.kind.title()
         kind = sel.kind
         item_id = sel.id
@@ -551,8 +673,8 @@ class LitteraApp(App):
         async def on_title_result(title: str | None) -> None:
             if title is None:
                 return
-            actions.update_title(self.state.db, kind, item_id, title)
-            self._render_view()
+            self.state.cache.titles.pop((kind, item_id), None)
+            self._db(actions.update_title, self.state.db, kind, item_id, title)
 
         self.push_screen(
             InputDialog(f"Edit {kind_label}", "New title:", current_title),
@@ -570,13 +692,14 @@ class LitteraApp(App):
             return
 
         block_id = sel.id
-        current_lang = queries.fetch_block_text(self.state.db, block_id)[0]
+        cached = self.state.cache.block_texts.get(block_id)
+        current_lang = (cached or queries.fetch_block_text(self.state.db, block_id))[0]
 
         async def on_lang_result(language: str | None) -> None:
             if not language:
                 return
-            actions.set_block_language(self.state.db, block_id, language)
-            self._render_view()
+            self.state.cache.block_texts.pop(block_id, None)
+            self._db(actions.set_block_language, self.state.db, block_id, language)
 
         self.push_screen(
             InputDialog("Set Language", "Language:", current_lang),
@@ -614,9 +737,14 @@ class LitteraApp(App):
         async def on_confirm(confirmed: bool) -> None:
             if not confirmed:
                 return
-            actions.delete_item(self.state.db, kind, item_id)
-            self.state.dispatch(ClearSelection())
-            self._render_view()
+            self.state.cache.titles.pop((kind, item_id), None)
+            self.state.cache.block_texts.pop(item_id, None)
+            if kind == "section" and self.state.current_document:
+                self.state.cache.section_orders.pop(self.state.current_document.id, None)
+            self._db(
+                actions.delete_item, self.state.db, kind, item_id,
+                on_done=lambda _: self.state.dispatch(ClearSelection()),
+            )
 
         self.push_screen(
             ConfirmDialog(f"Delete {kind_label}?", "This cannot be undone."),
@@ -638,12 +766,19 @@ class LitteraApp(App):
         async def on_name_result(name: str | None) -> None:
             if not name:
                 return
-            try:
-                actions.link_entity(self.state.db, block_id, name)
-            except LookupError:
-                return
-            if hasattr(self, "notify"):
-                self.notify(f"Linked to {name}")
+
+            def link() -> bool:
+                try:
+                    actions.link_entity(self.state.db, block_id, name)
+                except LookupError:
+                    return False
+                return True
+
+            def linked(ok: bool) -> None:
+                if ok:
+                    self.notify(f"Linked to {name}")
+
+            self._db(link, on_done=linked)
 
         self.push_screen(
             InputDialog("Link to Entity", "Entity Name:", ""), on_name_result
@@ -663,9 +798,11 @@ class LitteraApp(App):
         async def on_confirm(confirmed: bool) -> None:
             if not confirmed:
                 return
-            actions.delete_entity(self.state.db, entity_id)
-            self.state.dispatch(EntitiesClearSelection())
-            self._render_view()
+            self.state.cache.entity_notes.pop(entity_id, None)
+            self._db(
+                actions.delete_entity, self.state.db, entity_id,
+                on_done=lambda _: self.state.dispatch(EntitiesClearSelection()),
+            )
 
         self.push_screen(
             ConfirmDialog("Delete Entity?", "This will also delete all mentions and labels for this entity."),
@@ -694,8 +831,7 @@ class LitteraApp(App):
             async def on_form_result(base_form: str | None) -> None:
                 if not base_form:
                     return
-                actions.add_entity_label(self.state.db, entity_id, language, base_form)
-                self._render_view()
+                self._db(actions.add_entity_label, self.state.db, entity_id, language, base_form)
 
             self.push_screen(
                 InputDialog("Add Label", "Base form:", ""),
@@ -721,12 +857,17 @@ class LitteraApp(App):
         async def on_lang_result(language: str | None) -> None:
             if not language:
                 return
-            deleted = actions.delete_entity_label(self.state.db, entity_id, language)
-            if deleted:
-                self.notify(f"Label deleted ({language})")
-            else:
-                self.notify(f"No {language} label found", severity="warning")
-            self._render_view()
+
+            def report(deleted: bool) -> None:
+                if deleted:
+                    self.notify(f"Label deleted ({language})")
+                else:
+                    self.notify(f"No {language} label found", severity="warning")
+
+            self._db(
+                actions.delete_entity_label, self.state.db, entity_id, language,
+                on_done=report,
+            )
 
         self.push_screen(
             InputDialog("Delete Label", "Language to delete:", ""),
@@ -750,9 +891,10 @@ class LitteraApp(App):
                     self.notify("Format: key=value", severity="warning")
                 return
             key, value = kv.split("=", 1)
-            actions.set_entity_property(self.state.db, entity_id, key, value)
-            self.notify(f"Property set: {key}={value}")
-            self._render_view()
+            self._db(
+                actions.set_entity_property, self.state.db, entity_id, key, value,
+                on_done=lambda _: self.notify(f"Property set: {key}={value}"),
+            )
 
         self.push_screen(
             InputDialog("Set Property", "key=value:", ""),
@@ -773,12 +915,17 @@ class LitteraApp(App):
         async def on_key_result(key: str | None) -> None:
             if not key:
                 return
-            deleted = actions.delete_entity_property(self.state.db, entity_id, key)
-            if deleted:
-                self.notify(f"Property deleted: {key}")
-            else:
-                self.notify(f"Property '{key}' not found", severity="warning")
-            self._render_view()
+
+            def report(deleted: bool) -> None:
+                if deleted:
+                    self.notify(f"Property deleted: {key}")
+                else:
+                    self.notify(f"Property '{key}' not found", severity="warning")
+
+            self._db(
+                actions.delete_entity_property, self.state.db, entity_id, key,
+                on_done=report,
+            )
 
         self.push_screen(
             InputDialog("Delete Property", "Property key:", ""),
@@ -825,12 +972,17 @@ class LitteraApp(App):
     def _create_alignment(self, src_id: str, tgt_id: str, atype: str) -> None:
         if self.state is None:
             return
-        result = actions.create_alignment(self.state.db, src_id, tgt_id, atype)
-        if result is None:
-            self.notify("Alignment already exists between these blocks", severity="warning")
-            return
-        self.state.dispatch(AlignmentsSelect(result))
-        self._render_view()
+
+        def select(alignment_id: str | None) -> None:
+            if alignment_id is None:
+                self.notify("Alignment already exists between these blocks", severity="warning")
+                return
+            self.state.dispatch(AlignmentsSelect(alignment_id))
+
+        self._db(
+            actions.create_alignment, self.state.db, src_id, tgt_id, atype,
+            on_done=select,
+        )
 
     @safe_action
     def action_delete_alignment(self) -> None:
@@ -846,9 +998,10 @@ class LitteraApp(App):
         async def on_confirm(confirmed: bool) -> None:
             if not confirmed:
                 return
-            actions.delete_alignment(self.state.db, alignment_id)
-            self.state.dispatch(AlignmentsClearSelection())
-            self._render_view()
+            self._db(
+                actions.delete_alignment, self.state.db, alignment_id,
+                on_done=lambda _: self.state.dispatch(AlignmentsClearSelection()),
+            )
 
         self.push_screen(
             ConfirmDialog("Delete Alignment?", "This cannot be undone."),
@@ -860,10 +1013,45 @@ class LitteraApp(App):
         """Show gap detection results in the detail panel."""
         if self.state is None or self.state.view != "alignments":
             return
+        sel = self.state.alignments.selection
 
-        gaps_text = queries.fetch_alignment_gaps(self.state.db)
-        self.state.alignments.detail = gaps_text
-        self._render_view()
+        def collect(db) -> str:
+            # Show the report as it grows, at most every GAPS_PROGRESS s
+            lines: list[str] = []
+            shown = time.monotonic()
+            for line in queries.iter_alignment_gaps(db):
+                lines.append(line)
+                if time.monotonic() - shown >= GAPS_PROGRESS:
+                    shown = time.monotonic()
+                    self.call_from_thread(self._show_gaps_progress, sel, "\n".join(lines))
+            return "\n".join(lines)
+
+        def done(text: str) -> None:
+            if self._gaps_wanted(sel):
+                self.state.alignments.gaps = text
+
+        self._show_gaps_progress(sel, "Checking alignments...")
+        # A long scan on its own pooled connection: keep it outside the
+        # lock so view refreshes and writes aren't held up behind it
+        self._db(collect, self.state.db, on_done=done, read_only=True, locked=False)
+
+    def _gaps_wanted(self, sel: Selection) -> bool:
+        """Whether a gap report started at sel still belongs on screen."""
+        state = self.state
+        return (
+            state is not None
+            and state.view == "alignments"
+            and state.alignments.selection == sel
+        )
+
+    def _show_gaps_progress(self, sel: Selection, text: str) -> None:
+        """Patch a partial gap report into the detail pane."""
+        if not self._gaps_wanted(sel):
+            return
+        try:
+            self.screen.query_one("#detail", Static).update(text)
+        except NoMatches:
+            pass
 
     # =====================
     # Mention management
@@ -918,9 +1106,10 @@ class LitteraApp(App):
                 self.notify(f"Invalid mention number (1-{len(mentions)})", severity="warning")
                 return
             mention_id = mentions[idx - 1][0]
-            actions.delete_mention(self.state.db, mention_id)
-            self.notify("Mention deleted")
-            self._render_view()
+            self._db(
+                actions.delete_mention, self.state.db, mention_id,
+                on_done=lambda _: self.notify("Mention deleted"),
+            )
 
         self.push_screen(
             InputDialog("Delete Mention", f"Mention # (1-{len(mentions)}):", ""),
@@ -970,9 +1159,6 @@ class LitteraApp(App):
     @safe_action
     def _apply_surface_form(self, mention_id: str, language: str, features_str: str) -> None:
         """Parse features, compute surface form, and update mention."""
-        import json
-        from littera.linguistics.dispatch import surface_form as dispatch_surface_form
-
         # Parse features string
         features: dict = {}
         for token in features_str.split(","):
@@ -987,51 +1173,14 @@ class LitteraApp(App):
                 key, value = token.split("=", 1)
                 features[key.strip()] = value.strip()
 
-        with self.state.db.cursor() as cur:
-            # Get entity_id for this mention
-            cur.execute(
-                "SELECT entity_id FROM mentions WHERE id = %s",
-                (mention_id,),
-            )
-            row = cur.fetchone()
-            if row is None:
-                return
-            entity_id = row[0]
+        def applied(result: str | None) -> None:
+            if result is not None:
+                self.notify(f'Surface form set: "{result}"')
 
-            # Look up base_form from entity_labels for this language
-            cur.execute(
-                "SELECT base_form FROM entity_labels WHERE entity_id = %s AND language = %s",
-                (entity_id, language),
-            )
-            row = cur.fetchone()
-            if row:
-                base_form = row[0]
-            else:
-                # Fall back to canonical_label
-                cur.execute(
-                    "SELECT canonical_label FROM entities WHERE id = %s",
-                    (entity_id,),
-                )
-                row = cur.fetchone()
-                base_form = row[0] if row else "?"
-
-            # Fetch entity properties
-            cur.execute(
-                "SELECT properties FROM entities WHERE id = %s",
-                (entity_id,),
-            )
-            row = cur.fetchone()
-            properties = row[0] if row and row[0] else None
-
-            result = dispatch_surface_form(language, base_form, features or None, properties)
-
-            cur.execute(
-                "UPDATE mentions SET surface_form = %s, features = %s WHERE id = %s",
-                (result, json.dumps(features) if features else None, mention_id),
-            )
-        self.state.db.commit()
-        self.notify(f'Surface form set: "{result}"')
-        self._render_view()
+        self._db(
+            actions.set_surface_form, self.state.db, mention_id, language, features,
+            on_done=applied,
+        )
 
     # =====================
     # Editing
@@ -1047,13 +1196,16 @@ class LitteraApp(App):
         if sel.kind != "entity" or not sel.id:
             return
 
-        work_id = self.state.work.get("work", {}).get("id") if self.state.work else None
-        try:
-            entity_type, name, note = queries.fetch_entity_note(
-                self.state.db, sel.id, work_id
-            )
-        except LookupError:
-            return
+        cached = self.state.cache.entity_notes.get(sel.id)
+        if cached is None:
+            try:
+                cached = queries.fetch_entity_note(
+                    self.state.db, sel.id, self.state.work_id
+                )
+            except LookupError:
+                return
+            self.state.cache.entity_notes[sel.id] = cached
+        entity_type, name, note = cached
 
         self._start_edit(
             EditTarget(kind="entity_note", id=sel.id),
@@ -1071,10 +1223,13 @@ class LitteraApp(App):
         if sel.kind != "block" or not sel.id:
             return
 
-        try:
-            lang, text = queries.fetch_block_text(self.state.db, sel.id)
-        except LookupError:
-            return
+        cached = self.state.cache.block_texts.get(sel.id)
+        if cached is None:
+            try:
+                cached = queries.fetch_block_text(self.state.db, sel.id)
+            except LookupError:
+                return
+        lang, text = cached
 
         self._start_edit(
             EditTarget(kind="block_text", id=sel.id),
@@ -1089,30 +1244,43 @@ class LitteraApp(App):
         if self.state.view != "editor":
             return
         session = self.state.edit_session
-        if session is None:
+        if session is None or self._saving:
             return
 
         new_text = self._get_editor_text()
 
+        if new_text == session.original_text:
+            # Nothing changed: skip the write and the undo entry
+            self.state.dispatch(ExitEditor())
+            self._render_view()
+            return
+
+        def saved(_) -> None:
+            self._saving = False
+            self.state.dispatch(
+                SaveAndExit(session.target, session.original_text, new_text)
+            )
+
+        def failed() -> None:
+            # Leave the editor open so the text can be saved again
+            self._saving = False
+
         if session.target.kind == "entity_note":
-            work_id = self.state.work.get("work", {}).get("id") if self.state.work else None
-            if work_id is None:
+            if self.state.work_id is None:
                 return
-            actions.save_entity_note(self.state.db, session.target.id, work_id, new_text)
+            self._saving = True
+            self._db(
+                actions.save_entity_note,
+                self.state.db, session.target.id, self.state.work_id, new_text,
+                on_done=saved, on_error=failed,
+            )
 
         elif session.target.kind == "block_text":
-            actions.save_block_text(self.state.db, session.target.id, new_text)
-
-        else:
-            return
-
-        self.state.undo_redo.record(
-            session.target,
-            session.original_text,
-            new_text,
-        )
-        self.state.dispatch(ExitEditor())
-        self._render_view()
+            self._saving = True
+            self._db(
+                actions.save_block_text, self.state.db, session.target.id, new_text,
+                on_done=saved, on_error=failed,
+            )
 
     def action_undo(self) -> None:
         if self.state is None or self.state.view != "editor":
@@ -1124,7 +1292,7 @@ class LitteraApp(App):
         if edit is None:
             return
 
-        session.current_text = edit.old
+        session.current_text = edit.undo(session.current_text)
         self._set_editor_text(session.current_text)
 
     def action_redo(self) -> None:
@@ -1137,7 +1305,7 @@ class LitteraApp(App):
         if edit is None:
             return
 
-        session.current_text = edit.new
+        session.current_text = edit.redo(session.current_text)
         self._set_editor_text(session.current_text)
 
     # =====================
@@ -1164,10 +1332,41 @@ class LitteraApp(App):
         self.state.dispatch(ExitEditor())
         self._render_view()
 
-    def _clear_undo_redo(self) -> None:
+    def _db(
+        self, fn, *args, on_done=None, on_error=None, read_only=False, locked=True
+    ) -> None:
+        """Run a DB call on a worker thread so the UI stays responsive.
+
+        Calls run one at a time, so writes never overlap; a long read
+        can opt out with locked=False. on_done(result) (or on_error() if
+        the call raised) and the re-render that follows are posted back
+        to the UI thread, so state is only ever mutated there. Unless
+        read_only, cached lists and detail panes are dropped first.
+        """
+
+        def work() -> None:
+            try:
+                with self._db_lock if locked else nullcontext():
+                    result = fn(*args)
+            except Exception as e:
+                logging.exception("DB call %s failed", fn.__name__)
+                self.call_from_thread(self.notify, f"Database error: {e}", severity="error")
+                if on_error is not None:
+                    self.call_from_thread(on_error)
+                return
+            self.call_from_thread(self._db_done, on_done, result, read_only)
+
+        self.run_worker(work, thread=True, group="db", exit_on_error=False)
+
+    def _db_done(self, on_done, result, read_only: bool) -> None:
         if self.state is None:
             return
-        self.state.undo_redo.clear()
+        if not read_only:
+            # Lists, counts and texts on screen may have changed
+            self.state.cache.drop_rendered()
+        if on_done is not None:
+            on_done(result)
+        self._render_view()
 
     def _get_editor_text(self) -> str:
         """Read current text from the editor widget."""
@@ -1175,43 +1374,59 @@ class LitteraApp(App):
             return ""
         session = self.state.edit_session
         fallback = session.current_text if session else ""
-        try:
-            widget = self.screen.query_one("#editor")
-            if hasattr(widget, "text"):
-                return str(widget.text)
-            if hasattr(widget, "value"):
-                return str(widget.value)
-        except NoMatches:
-            pass
+        widget = self._editor_widget()
+        if widget is not None:
+            return str(getattr(widget, self._editor_attr))
         return str(fallback)
 
     def _set_editor_text(self, text: str) -> None:
         """Write text into the editor widget, suppressing change events."""
-        try:
-            widget = self.screen.query_one("#editor")
-        except NoMatches:
+        widget = self._editor_widget()
+        if widget is None:
             return
 
         self._suppress_editor_change_events = True
         try:
-            if hasattr(widget, "text"):
-                widget.text = text
-            elif hasattr(widget, "value"):
-                widget.value = text
+            setattr(widget, self._editor_attr, text)
         finally:
             self._suppress_editor_change_events = False
 
-    def _render_view(self) -> None:
+    def _editor_widget(self) -> Widget | None:
+        """The mounted editor widget, cached after the editor view renders."""
+        if self._editor is None or not self._editor.is_attached:
+            try:
+                self._remember_editor(self.screen.query_one("#editor"))
+            except NoMatches:
+                self._editor = None
+        return self._editor
+
+    def _remember_editor(self, editor: Widget) -> None:
+        self._editor = editor
+        # TextArea holds its content in .text, the Input fallback in .value
+        self._editor_attr = "text" if hasattr(editor, "text") else "value"
+
+    def _render_view(self, soft: bool = False) -> None:
         """Schedule a view re-render.
 
         Textual's `remove_children()` / `mount()` are async. If we call them
         synchronously, removals are deferred and we can briefly have duplicate ids
         in the DOM (crash on start / fast navigation).
+
+        Soft renders (highlight moves) are debounced so holding an arrow key
+        renders once the keys stop, not once per row; any other render
+        supersedes a pending soft one.
         """
 
         if self.state is None:
             return
 
+        if self._render_timer is not None:
+            self._render_timer.stop()
+            self._render_timer = None
+        if soft:
+            self._render_timer = self.set_timer(RENDER_DEBOUNCE, self._render_settled)
+            return
+
         self.run_worker(
             self._render_view_async(),
             group="render",
@@ -1219,44 +1434,82 @@ class LitteraApp(App):
             exit_on_error=False,
         )
 
-    def _refresh_data(self) -> None:
-        """Pre-load view data from DB into state before rendering."""
-        if self.state is None:
-            return
-        if self.state.view == "outline":
-            queries.refresh_outline(self.state)
-        elif self.state.view == "entities":
-            queries.refresh_entities(self.state)
-        elif self.state.view == "alignments":
-            queries.refresh_alignments(self.state)
-        elif self.state.view == "reviews":
-            queries.refresh_reviews(self.state)
+    def _render_settled(self) -> None:
+        """Debounced soft render: skipped if the highlight came back to
+        what is already on screen."""
+        self._render_timer = None
+        if self._render_signature() != self._rendered_signature:
+            self._render_view()
+
+    def _render_signature(self) -> tuple:
+        """What a soft render depends on: view, path and selection."""
+        state = self.state
+        return (
+            state.view,
+            tuple(p.id for p in state.path),
+            state.view_selection,
+            state.edit_session is not None,
+        )
+
+    def _load_data(self):
+        """Read view data from DB for the next render.
+
+        Runs on a worker thread (see _render_view_async) and returns the
+        loader's apply(), which the caller runs back on the UI thread. It
+        takes the same lock as _db, so a load never reads halfway through
+        a write and loads from superseded renders finish before the next
+        one starts.
+        """
+        state = self.state
+        if state is None:
+            return None
+        load = _VIEW_LOADERS.get(state.view)
+        if load is None:
+            return None
+        with self._db_lock:
+            return load(state)
 
     async def _render_view_async(self) -> None:
         if self.state is None:
             return
 
-        self._refresh_data()
+        # Queries block; keep them off the event loop so keys still land
+        apply = await asyncio.to_thread(self._load_data)
+        if apply is not None:
+            apply()
 
         try:
             container = self.screen.query_one("#main")
         except NoMatches:
             return
 
+        view = self.views[self.state.view]
+
+        signature = self._render_signature()
+
+        # Same view still mounted: patch its widgets instead of rebuilding
+        if self._mounted_view == view.name and await view.update(self.state, container):
+            self._rendered_signature = signature
+            return
+
+        self._mounted_view = None
         await container.remove_children()
 
-        view = self.views[self.state.view]
         widgets = view.render(self.state)
         await container.mount_all(widgets)
+        self._mounted_view = view.name
+        self._rendered_signature = signature
 
         # Focus the appropriate widget for each view
         if self.state.view == "editor":
             try:
                 editor = self.screen.query_one("#editor")
+                self._remember_editor(editor)
                 editor.focus()
             except NoMatches:
                 pass
         elif self.state.view in ("outline", "entities", "alignments", "reviews"):
+            self._editor = None
             try:
                 nav = self.screen.query_one("#nav")
                 nav.focus()
@@ -1314,11 +1567,12 @@ class LitteraApp(App):
 
     def _parse_widget_id(self, raw: str) -> tuple[str | None, str]:
         # Textual ids can't start with a digit, so we prefix UUIDs.
-        if "-" not in raw:
+        idx = raw.find("-")
+        if idx < 0:
             return None, raw
-        prefix, rest = raw.split("-", 1)
-        if prefix in {"doc", "sec", "blk", "ent", "aln", "rev"}:
-            return prefix, rest
+        prefix = raw[:idx]
+        if prefix in _WIDGET_PREFIXES:
+            return prefix, raw[idx + 1:]
         return None, raw
 
     def _set_selection_from_list_item(self, item_id: str) -> bool:
@@ -1365,24 +1619,13 @@ class LitteraApp(App):
 
         if self.state.view == "outline":
             prefix, raw_uuid = self._parse_widget_id(item_id)
-            prefix_kind_map = {
-                "doc": "document",
-                "sec": "section",
-                "blk": "block",
-            }
-
-            if prefix in prefix_kind_map:
-                kind = prefix_kind_map[prefix]
+
+            if prefix in _PREFIX_KINDS:
+                kind = _PREFIX_KINDS[prefix]
                 raw_id = raw_uuid
             else:
                 # Fallback: infer kind from current nav_level
-                nav_level = self.state.nav_level
-                kind_map = {
-                    "documents": "document",
-                    "sections": "section",
-                    "blocks": "block",
-                }
-                kind = kind_map.get(nav_level, "document")
+                kind = _NAV_LEVEL_KINDS.get(self.state.nav_level, "document")
                 raw_id = item_id
 
             current = self.state.outline.selection
@@ -1397,7 +1640,7 @@ class LitteraApp(App):
     @safe_action
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         """Update selection and right-hand detail on highlight."""
-        if self.state is None:
+        if self.state is None or event.item is None:
             return
 
         item_id = event.item.id
@@ -1405,8 +1648,17 @@ class LitteraApp(App):
             return
 
         changed = self._set_selection_from_list_item(str(item_id))
+        soft = True
+        if (
+            self.state.view == "outline"
+            and self.state.outline.has_more
+            and event.list_view.index == len(event.list_view) - 1
+        ):
+            # Reached the last loaded block: load the next page
+            self.state.dispatch(OutlineShowMore())
+            changed, soft = True, False
         if changed:
-            self._render_view()
+            self._render_view(soft=soft)
 
     @safe_action
     def on_list_view_selected(self, event: ListView.Selected) -> None:
@@ -4,11 +4,57 @@ All database reads needed to populate view state live here.
 Views become pure functions of state — no DB access in render().
 
 Usage in app.py:
-    queries.refresh_outline(state)   # before OutlineView.render()
-    queries.refresh_entities(state)  # before EntitiesView.render()
+    apply = queries.load_outline(state)   # on a worker thread
+    apply()                               # on the UI thread, before render
+
+refresh_outline(state) and friends do both at once.
 """
 
-from littera.tui.state import AppState, OutlineItem, EntityItem, AlignmentItem, ReviewItem
+from collections.abc import Callable, Iterator
+from contextlib import nullcontext
+
+import psycopg
+
+from littera.tui.state import (
+    BLOCK_PAGE_SIZE,
+    DETAIL_CACHE_SIZE,
+    AppState,
+    OutlineItem,
+    PathElement,
+    Selection,
+    EntityItem,
+    AlignmentItem,
+    ReviewItem,
+)
+
+# Characters of block text shown in list rows and mention previews
+PREVIEW_LENGTH = 60
+
+# Rows per round trip for reports read through server-side cursors
+ITERSIZE = 500
+
+
+def _pipeline(conn):
+    """Pipeline mode where libpq supports it (14+), else a no-op.
+
+    Queries executed inside are sent together and answered in one round
+    trip, on the first fetch.
+    """
+    return conn.pipeline() if psycopg.Pipeline.is_supported() else nullcontext()
+
+
+def _cached_detail(state: AppState, kind: str, item_id: str, build) -> str:
+    """Detail text for (kind, id) from state.cache, calling build() on a miss."""
+    details = state.cache.details
+    key = (kind, item_id)
+    detail = details.pop(key, None)
+    if detail is None:
+        detail = build()
+        if len(details) >= DETAIL_CACHE_SIZE:
+            del details[next(iter(details))]
+    # (Re)insert last: dict order doubles as the LRU order
+    details[key] = detail
+    return detail
 
 
 # =============================================================================
@@ -17,86 +63,214 @@ from littera.tui.state import AppState, OutlineItem, EntityItem, AlignmentItem,
 
 def refresh_outline(state: AppState) -> None:
     """Populate state.outline.items and state.outline.detail from DB."""
-    items: list[OutlineItem] = []
+    load_outline(state)()
+
+
+def load_outline(state: AppState) -> Callable[[], None]:
+    """Read the current outline level; returns apply() to store it in state.
+
+    Safe on a worker thread: path, selection and block window are read
+    once up front, and the reads only fill state.cache under keys taken
+    from them. apply() writes state.outline, so it belongs on the UI
+    thread; it does nothing if the user has moved on meanwhile.
+    """
+    path = tuple(state.path)
+    sel = state.outline.selection
+    start_limit = state.outline.block_limit
+    limit = start_limit
     detail = ""
 
-    nav_level = state.nav_level
-    model_help = ""  # Views handle help text display
-
-    with state.db.cursor() as cur:
-        if not state.path:
-            # Documents level
-            cur.execute("SELECT id, title FROM documents ORDER BY order_index NULLS LAST, created_at")
-            for doc_id, title in cur.fetchall():
-                items.append(OutlineItem(id=str(doc_id), kind="document", title=title))
-        else:
-            last = state.path[-1]
-            if last.kind == "document":
-                cur.execute(
-                    "SELECT id, title FROM sections WHERE document_id = %s ORDER BY order_index NULLS LAST, created_at",
-                    (last.id,),
+    with state.db.connection() as conn, conn.cursor() as cur:
+        cached = state.cache.lists.get(_outline_list_key(path, limit))
+        selected = _find_item(cached[0], sel.id) if cached and sel.id else None
+        # A selection missing from the rows means they are stale, or
+        # (for blocks) that the window has to grow to reach it
+        if cached is None or (sel.id and selected is None):
+            items, has_more, limit = _outline_items(cur, state, path, sel, limit)
+            # Stored under the window actually read, which may have grown
+            cached = state.cache.lists[_outline_list_key(path, limit)] = (items, has_more)
+            selected = _find_item(items, sel.id) if sel.id else None
+        items, has_more = cached
+
+        # Detail for selected item: documents and sections are fully
+        # described by their listed row
+        if selected is not None and selected.kind != "block":
+            detail = _container_detail(selected.kind, selected.title, selected.children)
+        elif sel.id:
+            detail = _cached_detail(state, sel.kind, sel.id, lambda: _outline_detail(cur, sel))
+
+    def apply() -> None:
+        outline = state.outline
+        if (
+            tuple(outline.path) != path
+            or outline.selection != sel
+            or outline.block_limit != start_limit
+        ):
+            return
+        outline.items = items
+        outline.detail = detail
+        outline.has_more = has_more
+        outline.block_limit = limit
+
+    return apply
+
+
+def _find_item(items: list[OutlineItem], item_id: str) -> OutlineItem | None:
+    return next((item for item in items if item.id == item_id), None)
+
+
+def _outline_list_key(path: tuple[PathElement, ...], block_limit: int) -> tuple:
+    if not path:
+        return ("documents",)
+    last = path[-1]
+    if last.kind == "section":
+        return ("blocks", last.id, block_limit)
+    return (last.kind, last.id)
+
+
+def _outline_items(
+    cur, state: AppState, path: tuple[PathElement, ...], sel: Selection, limit: int
+) -> tuple[list[OutlineItem], bool, int]:
+    """Read the rows of an outline level. Returns (items, has_more, limit).
+
+    limit is the block window read, grown past the one passed in if the
+    selected block lay beyond it.
+    """
+    items: list[OutlineItem] = []
+    has_more = False
+
+    if not path:
+        # Documents level
+        cur.execute(
+            "SELECT d.id, d.title, COUNT(s.id) "
+            "FROM documents d LEFT JOIN sections s ON s.document_id = d.id "
+            "GROUP BY d.id ORDER BY d.order_index NULLS LAST, d.created_at"
+        )
+        for doc_id, title, sec_count in cur.fetchall():
+            items.append(
+                OutlineItem(id=str(doc_id), kind="document", title=title, children=sec_count)
+            )
+            state.cache.titles["document", str(doc_id)] = title
+    else:
+        last = path[-1]
+        if last.kind == "document":
+            cur.execute(
+                "SELECT s.id, s.title, s.order_index, COUNT(b.id) "
+                "FROM sections s LEFT JOIN blocks b ON b.section_id = s.id "
+                "WHERE s.document_id = %s "
+                "GROUP BY s.id ORDER BY s.order_index NULLS LAST, s.created_at",
+                (last.id,),
+            )
+            max_order = 0
+            for sec_id, title, order_index, block_count in cur.fetchall():
+                items.append(
+                    OutlineItem(id=str(sec_id), kind="section", title=title, children=block_count)
                 )
-                for sec_id, title in cur.fetchall():
-                    items.append(OutlineItem(id=str(sec_id), kind="section", title=title))
-            elif last.kind == "section":
-                cur.execute(
-                    "SELECT id, language, source_text FROM blocks WHERE section_id = %s ORDER BY created_at",
-                    (last.id,),
+                state.cache.titles["section", str(sec_id)] = title
+                if order_index is not None and order_index > max_order:
+                    max_order = order_index
+            # Never lower it: an add still in flight may have reserved
+            # the next index already
+            orders = state.cache.section_orders
+            orders[last.id] = max(max_order, orders.get(last.id, 0))
+        elif last.kind == "section":
+            rows, has_more, limit = _fetch_block_window(cur, last.id, sel, limit)
+            for block_id, lang, text, whole in rows:
+                if whole:
+                    state.cache.block_texts[str(block_id)] = (lang, text)
+                else:
+                    # Grown past the preview since it was cached whole
+                    state.cache.block_texts.pop(str(block_id), None)
+                preview = text.replace("\n", " ")
+                items.append(
+                    OutlineItem(id=str(block_id), kind="block", title=preview, language=lang)
                 )
-                for block_id, lang, text in cur.fetchall():
-                    preview = text.replace("\n", " ")[:60]
-                    items.append(
-                        OutlineItem(id=str(block_id), kind="block", title=preview, language=lang)
-                    )
 
-        # Detail for selected item
-        sel = state.entity_selection
-        if sel and sel.id:
-            detail = _outline_detail(cur, sel)
+    return items, has_more, limit
 
-    state.outline.items = items
-    state.outline.detail = detail
+
+def _fetch_block_window(
+    cur, section_id: str, sel: Selection, limit: int
+) -> tuple[list, bool, int]:
+    """Fetch the first limit blocks of a section.
+
+    Rows are (id, language, text, whole): text is cut to the preview
+    length, and whole says whether that is the entire block. Grows the
+    window if the selected block lies beyond it. Returns (rows,
+    has_more, limit).
+    """
+    query = (
+        "SELECT id, language, left(source_text, %(n)s), char_length(source_text) <= %(n)s "
+        "FROM blocks WHERE section_id = %(section)s ORDER BY created_at LIMIT %(limit)s"
+    )
+    params = {"n": PREVIEW_LENGTH, "section": section_id, "limit": limit + 1}
+    cur.execute(query, params)
+    rows = cur.fetchall()
+
+    if len(rows) > limit and sel.kind == "block" and sel.id:
+        if not any(str(row[0]) == sel.id for row in rows[:limit]):
+            cur.execute(
+                "SELECT COUNT(*) FROM blocks WHERE section_id = %s "
+                "AND created_at <= (SELECT created_at FROM blocks WHERE id = %s)",
+                (section_id, sel.id),
+            )
+            position = cur.fetchone()[0]
+            if position > limit:
+                pages = -(-position // BLOCK_PAGE_SIZE)
+                limit = pages * BLOCK_PAGE_SIZE
+                cur.execute(query, {**params, "limit": limit + 1})
+                rows = cur.fetchall()
+
+    return rows[:limit], len(rows) > limit, limit
+
+
+def _container_detail(kind: str, title: str, children: int) -> str:
+    """Detail string for a document or section."""
+    if kind == "document":
+        return f"Document: {title}\nSections: {children}\n\nEnter: drill down"
+    return f"Section: {title}\nBlocks: {children}\n\nEnter: drill down"
 
 
 def _outline_detail(cur, sel) -> str:
-    """Build detail string for the selected outline item."""
+    """Build detail string for the selected outline item.
+
+    Each kind needs one round-trip: the title (or text) and the child
+    count come back in the same row. Listed documents and sections don't
+    get here; their rows already carry both.
+    """
     raw_id = sel.id
 
     if sel.kind == "document":
-        cur.execute("SELECT title FROM documents WHERE id = %s", (raw_id,))
-        row = cur.fetchone()
-        title = row[0] if row else raw_id
         cur.execute(
-            "SELECT COUNT(*) FROM sections WHERE document_id = %s",
-            (raw_id,),
+            "SELECT (SELECT title FROM documents WHERE id = %(id)s), "
+            "(SELECT COUNT(*) FROM sections WHERE document_id = %(id)s)",
+            {"id": raw_id},
+            prepare=True,
         )
-        sec_count = cur.fetchone()[0]
-        return f"Document: {title}\nSections: {sec_count}\n\nEnter: drill down"
+        title, sec_count = cur.fetchone()
+        return _container_detail("document", title or raw_id, sec_count)
 
     elif sel.kind == "section":
-        cur.execute("SELECT title FROM sections WHERE id = %s", (raw_id,))
-        row = cur.fetchone()
-        title = row[0] if row else raw_id
         cur.execute(
-            "SELECT COUNT(*) FROM blocks WHERE section_id = %s",
-            (raw_id,),
+            "SELECT (SELECT title FROM sections WHERE id = %(id)s), "
+            "(SELECT COUNT(*) FROM blocks WHERE section_id = %(id)s)",
+            {"id": raw_id},
+            prepare=True,
         )
-        block_count = cur.fetchone()[0]
-        return f"Section: {title}\nBlocks: {block_count}\n\nEnter: drill down"
+        title, block_count = cur.fetchone()
+        return _container_detail("section", title or raw_id, block_count)
 
     elif sel.kind == "block":
         cur.execute(
-            "SELECT language, source_text FROM blocks WHERE id = %s",
+            "SELECT b.language, b.source_text, "
+            "(SELECT COUNT(*) FROM mentions m WHERE m.block_id = b.id) "
+            "FROM blocks b WHERE b.id = %s",
             (raw_id,),
+            prepare=True,
         )
         row = cur.fetchone()
         if row:
-            lang, text = row
-            cur.execute(
-                "SELECT COUNT(*) FROM mentions WHERE block_id = %s",
-                (raw_id,),
-            )
-            mention_count = cur.fetchone()[0]
+            lang, text, mention_count = row
             mention_info = f"  Mentions: {mention_count}" if mention_count > 0 else ""
             return f"Block ({lang}){mention_info}\n\n{text}\n\nEnter: edit  l: link  M: mentions"
         return f"Block: {raw_id}"
@@ -110,88 +284,92 @@ def _outline_detail(cur, sel) -> str:
 
 def refresh_entities(state: AppState) -> None:
     """Populate state.entities.items and state.entities.detail from DB."""
+    load_entities(state)()
+
+
+def load_entities(state: AppState) -> Callable[[], None]:
+    """Read the entity list and detail; returns apply(), as load_outline."""
     items: list[EntityItem] = []
     detail = "Select an entity"
-
-    with state.db.cursor() as cur:
-        cur.execute(
-            "SELECT id, entity_type, canonical_label FROM entities ORDER BY created_at"
-        )
-        for row in cur.fetchall():
-            if not isinstance(row, (list, tuple)) or len(row) < 3:
-                continue
-            entity_id, entity_type, name = row[0], row[1], row[2]
-            label = name or "(unnamed)"
-            items.append(EntityItem(id=str(entity_id), entity_type=entity_type, label=label))
+    sel = state.entities.selection
+    work_id = state.work_id
+
+    with (
+        state.db.connection() as conn,
+        _pipeline(conn),
+        conn.cursor() as cur,
+        conn.cursor() as detail_cur,
+    ):
+        cached = state.cache.lists.get(("entities",))
+        if cached is None:
+            # Queued, not sent: a detail miss below goes out with it
+            cur.execute(
+                "SELECT id, entity_type, canonical_label FROM entities ORDER BY created_at"
+            )
 
         # Detail for selected entity
-        sel = state.entity_selection
-        if sel and sel.kind == "entity" and sel.id:
-            detail = _entity_detail(cur, sel.id, state.work)
+        if sel.kind == "entity" and sel.id:
+            detail = _cached_detail(
+                state, "entity", sel.id, lambda: _entity_detail(detail_cur, sel.id, work_id)
+            )
 
-    state.entities.items = items
-    state.entities.detail = detail
+        if cached is None:
+            for entity_id, entity_type, name in cur.fetchall():
+                label = name or "(unnamed)"
+                items.append(EntityItem(id=str(entity_id), entity_type=entity_type, label=label))
+            cached = state.cache.lists[("entities",)] = (items, False)
+        items = cached[0]
 
+    def apply() -> None:
+        if state.entities.selection != sel:
+            return
+        state.entities.items = items
+        state.entities.detail = detail
 
-def _entity_detail(cur, entity_id: str, work: dict | None) -> str:
-    """Build detail string for a selected entity."""
-    cur.execute(
-        "SELECT entity_type, canonical_label FROM entities WHERE id = %s",
-        (entity_id,),
-    )
-    row = cur.fetchone()
-    if row:
-        entity_type, name = row
-    else:
-        entity_type, name = "?", entity_id
-
-    work_id = None
-    if work and "work" in work:
-        work_id = work["work"].get("id")
+    return apply
 
-    note = None
-    if work_id is not None:
-        cur.execute(
-            """
-            SELECT metadata->>'note'
-            FROM entity_work_metadata
-            WHERE entity_id = %s AND work_id = %s
-            """,
-            (entity_id, work_id),
-        )
-        note_row = cur.fetchone()
-        note = note_row[0] if note_row else None
-
-    cur.execute(
-        """
-        SELECT language, base_form, aliases
-        FROM entity_labels
-        WHERE entity_id = %s
-        ORDER BY language
-        """,
-        (entity_id,),
-    )
-    labels = cur.fetchall()
 
+def _entity_detail(cur, entity_id: str, work_id: str | None) -> str:
+    """Build detail string for a selected entity."""
+    # One round-trip: the entity row plus its note, labels and latest
+    # mentions aggregated as JSON arrays.
     cur.execute(
         """
-        SELECT d.title, s.title, b.language, b.source_text, m.entity_id, m.block_id
-        FROM mentions m
-        JOIN blocks b ON b.id = m.block_id
-        JOIN sections s ON s.id = b.section_id
-        JOIN documents d ON d.id = s.document_id
-        WHERE m.entity_id = %s
-        ORDER BY b.created_at DESC
-        LIMIT 10
+        SELECT e.entity_type, e.canonical_label, e.properties,
+               (SELECT metadata->>'note'
+                FROM entity_work_metadata
+                WHERE entity_id = k.id AND work_id = %(work_id)s),
+               (SELECT json_agg(json_build_array(language, base_form, aliases)
+                                ORDER BY language)
+                FROM entity_labels
+                WHERE entity_id = k.id),
+               (SELECT json_agg(json_build_array(doc_title, sec_title, language, source_text)
+                                ORDER BY created_at DESC)
+                FROM (
+                    SELECT d.title AS doc_title, s.title AS sec_title,
+                           b.language, left(b.source_text, %(n)s) AS source_text,
+                           b.created_at
+                    FROM mentions m
+                    JOIN blocks b ON b.id = m.block_id
+                    JOIN sections s ON s.id = b.section_id
+                    JOIN documents d ON d.id = s.document_id
+                    WHERE m.entity_id = k.id
+                    ORDER BY b.created_at DESC
+                    LIMIT 10
+                ) recent)
+        FROM (SELECT %(entity_id)s::uuid AS id) k
+        LEFT JOIN entities e ON e.id = k.id
         """,
-        (entity_id,),
+        {"entity_id": entity_id, "work_id": work_id, "n": PREVIEW_LENGTH},
+        prepare=True,
     )
-    mentions = cur.fetchall()
-
-    # Properties
-    cur.execute("SELECT properties FROM entities WHERE id = %s", (entity_id,))
-    prop_row = cur.fetchone()
-    properties = prop_row[0] if prop_row and prop_row[0] else {}
+    row = cur.fetchone()
+    entity_type, name, properties, note, labels, mentions = row
+    if entity_type is None:
+        entity_type, name = "?", entity_id
+    properties = properties or {}
+    labels = labels or []
+    mentions = mentions or []
 
     detail_lines = [f"Entity: {entity_type} {name}", ""]
 
@@ -215,15 +393,8 @@ def _entity_detail(cur, entity_id: str, work: dict | None) -> str:
 
     if mentions:
         detail_lines.append("Mentions:")
-        for (
-            doc_title,
-            sec_title,
-            lang,
-            text,
-            mention_entity_id,
-            mention_block_id,
-        ) in mentions:
-            preview = text.replace("\n", " ")[:60]
+        for doc_title, sec_title, lang, text in mentions:
+            preview = text.replace("\n", " ")
             detail_lines.append(
                 f"  - {doc_title} / {sec_title} ({lang}) {preview}"
             )
@@ -240,34 +411,58 @@ def _entity_detail(cur, entity_id: str, work: dict | None) -> str:
 
 def refresh_reviews(state: AppState) -> None:
     """Populate state.reviews.items and detail from DB."""
-    items: list[ReviewItem] = []
-    work_id = state.work.get("work", {}).get("id") if state.work else None
+    load_reviews(state)()
 
-    with state.db.cursor() as cur:
-        cur.execute("""
-            SELECT id, scope, scope_id, issue_type, description, severity
-            FROM reviews
-            WHERE work_id = %s
-            ORDER BY created_at
-        """, (work_id,))
-        for rid, scope, scope_id, issue_type, desc, severity in cur.fetchall():
-            preview = (desc or "").replace("\n", " ")[:60]
-            items.append(ReviewItem(
-                id=str(rid),
-                severity=severity or "medium",
-                scope=scope or "",
-                issue_type=issue_type or "",
-                description=preview,
-            ))
+
+def load_reviews(state: AppState) -> Callable[[], None]:
+    """Read the review list and detail; returns apply(), as load_outline."""
+    items: list[ReviewItem] = []
+    detail = "Select a review"
+    sel = state.reviews.selection
+    work_id = state.work_id
+
+    with (
+        state.db.connection() as conn,
+        _pipeline(conn),
+        conn.cursor() as cur,
+        conn.cursor() as detail_cur,
+    ):
+        cached = state.cache.lists.get(("reviews",))
+        if cached is None:
+            # Queued, not sent: a detail miss below goes out with it
+            cur.execute("""
+                SELECT id, scope, scope_id, issue_type, left(description, 60), severity
+                FROM reviews
+                WHERE work_id = %s
+                ORDER BY created_at
+            """, (work_id,))
 
         # Detail for selected review
-        sel = state.reviews.selection
-        detail = "Select a review"
-        if sel and sel.kind == "review" and sel.id:
-            detail = _review_detail(cur, sel.id)
+        if sel.kind == "review" and sel.id:
+            detail = _cached_detail(
+                state, "review", sel.id, lambda: _review_detail(detail_cur, sel.id)
+            )
 
-    state.reviews.items = items
-    state.reviews.detail = detail
+        if cached is None:
+            for rid, scope, scope_id, issue_type, desc, severity in cur.fetchall():
+                preview = (desc or "").replace("\n", " ")
+                items.append(ReviewItem(
+                    id=str(rid),
+                    severity=severity or "medium",
+                    scope=scope or "",
+                    issue_type=issue_type or "",
+                    description=preview,
+                ))
+            cached = state.cache.lists[("reviews",)] = (items, False)
+        items = cached[0]
+
+    def apply() -> None:
+        if state.reviews.selection != sel:
+            return
+        state.reviews.items = items
+        state.reviews.detail = detail
+
+    return apply
 
 
 def _review_detail(cur, review_id: str) -> str:
@@ -280,6 +475,7 @@ def _review_detail(cur, review_id: str) -> str:
         WHERE id = %s
         """,
         (review_id,),
+        prepare=True,
     )
     row = cur.fetchone()
     if row is None:
@@ -315,10 +511,11 @@ def _review_detail(cur, review_id: str) -> str:
 
 def fetch_entity_note(db, entity_id: str, work_id: str) -> tuple[str, str, str]:
     """Fetch entity info + note for editing. Returns (entity_type, name, note)."""
-    with db.cursor() as cur:
+    with db.connection() as conn, conn.cursor() as cur:
         cur.execute(
             "SELECT entity_type, canonical_label FROM entities WHERE id = %s",
             (entity_id,),
+            prepare=True,
         )
         row = cur.fetchone()
         if row is None:
@@ -334,6 +531,7 @@ def fetch_entity_note(db, entity_id: str, work_id: str) -> tuple[str, str, str]:
                 WHERE entity_id = %s AND work_id = %s
                 """,
                 (entity_id, work_id),
+                prepare=True,
             )
             note_row = cur.fetchone()
             note = note_row[0] if note_row and note_row[0] else ""
@@ -343,21 +541,21 @@ def fetch_entity_note(db, entity_id: str, work_id: str) -> tuple[str, str, str]:
 
 def fetch_block_text(db, block_id: str) -> tuple[str, str]:
     """Fetch block language and source_text. Returns (language, text)."""
-    with db.cursor() as cur:
-        cur.execute(
+    with db.connection() as conn:
+        row = conn.execute(
             "SELECT language, source_text FROM blocks WHERE id = %s",
             (block_id,),
-        )
-        row = cur.fetchone()
-        if row is None:
-            raise LookupError(f"Block {block_id} not found")
+            prepare=True,
+        ).fetchone()
+    if row is None:
+        raise LookupError(f"Block {block_id} not found")
     return row[0], row[1]
 
 
 def fetch_block_mentions(db, block_id: str) -> list[tuple[str, str, str, str, str | None]]:
     """Return list of (mention_id, entity_type, entity_label, language, surface_form) for a block."""
-    with db.cursor() as cur:
-        cur.execute(
+    with db.connection() as conn:
+        rows = conn.execute(
             """
             SELECT m.id, e.entity_type, e.canonical_label, m.language, m.surface_form
             FROM mentions m
@@ -366,23 +564,27 @@ def fetch_block_mentions(db, block_id: str) -> list[tuple[str, str, str, str, st
             ORDER BY e.canonical_label
             """,
             (block_id,),
-        )
-        return [
-            (str(r[0]), r[1], r[2] or "(unnamed)", r[3], r[4])
-            for r in cur.fetchall()
-        ]
+            prepare=True,
+        ).fetchall()
+    return [
+        (str(r[0]), r[1], r[2] or "(unnamed)", r[3], r[4])
+        for r in rows
+    ]
+
+
+_TITLE_QUERIES = {
+    "document": "SELECT title FROM documents WHERE id = %s",
+    "section": "SELECT title FROM sections WHERE id = %s",
+}
 
 
 def fetch_item_title(db, kind: str, item_id: str) -> str:
     """Fetch title for a document or section. Returns title string."""
-    with db.cursor() as cur:
-        if kind == "document":
-            cur.execute("SELECT title FROM documents WHERE id = %s", (item_id,))
-        elif kind == "section":
-            cur.execute("SELECT title FROM sections WHERE id = %s", (item_id,))
-        else:
-            return "Untitled"
-        row = cur.fetchone()
+    query = _TITLE_QUERIES.get(kind)
+    if query is None:
+        return "Untitled"
+    with db.connection() as conn:
+        row = conn.execute(query, (item_id,), prepare=True).fetchone()
     return row[0] if row else "Untitled"
 
 
@@ -392,35 +594,59 @@ def fetch_item_title(db, kind: str, item_id: str) -> str:
 
 def refresh_alignments(state: AppState) -> None:
     """Populate state.alignments.items from DB."""
+    load_alignments(state)()
+
+
+def load_alignments(state: AppState) -> Callable[[], None]:
+    """Read the alignment list and detail; returns apply(), as load_outline."""
     items: list[AlignmentItem] = []
     detail = "Select an alignment"
-
-    with state.db.cursor() as cur:
-        cur.execute("""
-            SELECT a.id, sb.language, sb.source_text,
-                   tb.language, tb.source_text, a.alignment_type
-            FROM block_alignments a
-            JOIN blocks sb ON sb.id = a.source_block_id
-            JOIN blocks tb ON tb.id = a.target_block_id
-            ORDER BY a.created_at
-        """)
-        for aid, sl, st, tl, tt, atype in cur.fetchall():
-            items.append(AlignmentItem(
-                id=str(aid),
-                source_lang=sl,
-                source_preview=st.replace("\n", " ")[:40],
-                target_lang=tl,
-                target_preview=tt.replace("\n", " ")[:40],
-                alignment_type=atype or "translation",
-            ))
+    sel = state.alignments.selection
+
+    with (
+        state.db.connection() as conn,
+        _pipeline(conn),
+        conn.cursor() as cur,
+        conn.cursor() as detail_cur,
+    ):
+        cached = state.cache.lists.get(("alignments",))
+        if cached is None:
+            # Queued, not sent: a detail miss below goes out with it
+            cur.execute("""
+                SELECT a.id, sb.language, left(sb.source_text, 40),
+                       tb.language, left(tb.source_text, 40), a.alignment_type
+                FROM block_alignments a
+                JOIN blocks sb ON sb.id = a.source_block_id
+                JOIN blocks tb ON tb.id = a.target_block_id
+                ORDER BY a.created_at
+            """)
 
         # Detail for selected alignment
-        sel = state.alignments.selection
-        if sel and sel.kind == "alignment" and sel.id:
-            detail = _alignment_detail(cur, sel.id)
+        if sel.kind == "alignment" and sel.id:
+            detail = _cached_detail(
+                state, "alignment", sel.id, lambda: _alignment_detail(detail_cur, sel.id)
+            )
+
+        if cached is None:
+            for aid, sl, st, tl, tt, atype in cur.fetchall():
+                items.append(AlignmentItem(
+                    id=str(aid),
+                    source_lang=sl,
+                    source_preview=st.replace("\n", " "),
+                    target_lang=tl,
+                    target_preview=tt.replace("\n", " "),
+                    alignment_type=atype or "translation",
+                ))
+            cached = state.cache.lists[("alignments",)] = (items, False)
+        items = cached[0]
 
-    state.alignments.items = items
-    state.alignments.detail = detail
+    def apply() -> None:
+        if state.alignments.selection != sel:
+            return
+        state.alignments.items = items
+        state.alignments.detail = detail
+
+    return apply
 
 
 def _alignment_detail(cur, alignment_id: str) -> str:
@@ -428,14 +654,15 @@ def _alignment_detail(cur, alignment_id: str) -> str:
     cur.execute(
         """
         SELECT a.alignment_type, a.confidence,
-               sb.language, sb.source_text,
-               tb.language, tb.source_text
+               sb.language, left(sb.source_text, 200),
+               tb.language, left(tb.source_text, 200)
         FROM block_alignments a
         JOIN blocks sb ON sb.id = a.source_block_id
         JOIN blocks tb ON tb.id = a.target_block_id
         WHERE a.id = %s
         """,
         (alignment_id,),
+        prepare=True,
     )
     row = cur.fetchone()
     if not row:
@@ -450,10 +677,10 @@ def _alignment_detail(cur, alignment_id: str) -> str:
         lines.append(f"Confidence: {confidence}")
     lines.append("")
     lines.append(f"Source ({src_lang}):")
-    lines.append(src_text[:200])
+    lines.append(src_text)
     lines.append("")
     lines.append(f"Target ({tgt_lang}):")
-    lines.append(tgt_text[:200])
+    lines.append(tgt_text)
     lines.append("")
     lines.append("d: delete  g: show gaps")
 
@@ -465,79 +692,73 @@ def fetch_alignment_gaps(db) -> str:
 
     Returns a formatted string describing the gaps found.
     """
-    lines: list[str] = []
+    return "\n".join(iter_alignment_gaps(db))
+
+
+def iter_alignment_gaps(db) -> Iterator[str]:
+    """Yield the gap report line by line, as alignment rows arrive.
+
+    Keeps a pooled connection until exhausted, so drain it promptly.
+    """
     total_gaps = 0
     no_gap_count = 0
 
-    with db.cursor() as cur:
+    # Server-side cursor: rows are formatted as they stream in, ITERSIZE
+    # at a time, rather than all held in memory first
+    with db.connection() as conn, conn.cursor(name="alignment_gaps") as cur:
+        cur.itersize = ITERSIZE
+        # One row per alignment. Gaps are mentioned entities with no label
+        # in the other block's language, checked in both directions and
+        # deduplicated per (label, language), source direction first.
         cur.execute("""
-            SELECT a.id, a.source_block_id, a.target_block_id,
-                   sb.language, sb.source_text,
-                   tb.language, tb.source_text
+            SELECT sb.language, left(sb.source_text, 40),
+                   tb.language, left(tb.source_text, 40),
+                   (SELECT json_agg(json_build_array(entity_type, canonical_label,
+                                                     from_lang, to_lang)
+                                    ORDER BY dir, canonical_label)
+                    FROM (
+                        SELECT DISTINCT ON (e.canonical_label, d.to_lang)
+                               d.dir, e.entity_type, e.canonical_label,
+                               d.from_lang, d.to_lang
+                        FROM (VALUES (0, a.source_block_id, sb.language, tb.language),
+                                     (1, a.target_block_id, tb.language, sb.language)
+                             ) d(dir, block_id, from_lang, to_lang)
+                        JOIN mentions m ON m.block_id = d.block_id
+                        JOIN entities e ON e.id = m.entity_id
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM entity_labels l
+                            WHERE l.entity_id = e.id AND l.language = d.to_lang
+                        )
+                        ORDER BY e.canonical_label, d.to_lang, d.dir
+                    ) g)
             FROM block_alignments a
             JOIN blocks sb ON sb.id = a.source_block_id
             JOIN blocks tb ON tb.id = a.target_block_id
             ORDER BY a.created_at
         """)
-        alignments = cur.fetchall()
-
-        if not alignments:
-            return "No alignments to check."
-
-        for _, src_block_id, tgt_block_id, src_lang, src_text, tgt_lang, tgt_text in alignments:
-            direction_gaps: list[tuple[str, str, str, str]] = []
-            for from_block_id, from_lang, to_lang in [
-                (src_block_id, src_lang, tgt_lang),
-                (tgt_block_id, tgt_lang, src_lang),
-            ]:
-                cur.execute(
-                    """
-                    SELECT DISTINCT e.id, e.entity_type, e.canonical_label
-                    FROM mentions m
-                    JOIN entities e ON e.id = m.entity_id
-                    WHERE m.block_id = %s
-                    """,
-                    (from_block_id,),
-                )
-                entities = cur.fetchall()
-
-                for eid, etype, canonical in entities:
-                    cur.execute(
-                        "SELECT 1 FROM entity_labels WHERE entity_id = %s AND language = %s",
-                        (eid, to_lang),
-                    )
-                    if not cur.fetchone():
-                        direction_gaps.append((etype, canonical, from_lang, to_lang))
-
-            if not direction_gaps:
+        for src_lang, src_text, tgt_lang, tgt_text, gaps in cur:
+            if not gaps:
                 no_gap_count += 1
                 continue
 
-            # Deduplicate
-            seen: set[tuple[str, str]] = set()
-            unique_gaps: list[tuple[str, str, str, str]] = []
-            for etype, canonical, from_lang, to_lang in direction_gaps:
-                key = (canonical, to_lang)
-                if key not in seen:
-                    seen.add(key)
-                    unique_gaps.append((etype, canonical, from_lang, to_lang))
-
-            src_preview = src_text.replace("\n", " ")[:40]
-            tgt_preview = tgt_text.replace("\n", " ")[:40]
-            lines.append(
+            src_preview = src_text.replace("\n", " ")
+            tgt_preview = tgt_text.replace("\n", " ")
+            yield (
                 f'({src_lang}) "{src_preview}" '
                 f'<-> ({tgt_lang}) "{tgt_preview}":'
             )
-            for etype, canonical, from_lang, to_lang in unique_gaps:
+            for etype, canonical, from_lang, to_lang in gaps:
                 total_gaps += 1
-                lines.append(f'  {etype} "{canonical}" -- no label for {to_lang}')
-            lines.append("")
+                yield f'  {etype} "{canonical}" -- no label for {to_lang}'
+            yield ""
+
+    if not total_gaps and not no_gap_count:
+        yield "No alignments to check."
+        return
 
     if no_gap_count:
-        lines.append(f"No gaps for {no_gap_count} other alignment(s).")
+        yield f"No gaps for {no_gap_count} other alignment(s)."
     if total_gaps == 0:
-        lines.append("No gaps found.")
+        yield "No gaps found."
     else:
-        lines.append(f"Total gaps: {total_gaps}")
-
-    return "\n".join(lines)
+        yield f"Total gaps: {total_gaps}"
@@ -12,7 +12,7 @@ Architecture:
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Literal, Any, Union
+from typing import Optional, Literal, Any, Union, get_args
 
 
 # =============================================================================
@@ -21,17 +21,18 @@ from typing import Optional, Literal, Any, Union
 
 ModeName = Literal["browse", "edit", "command"]
 ViewName = Literal["outline", "entities", "editor", "alignments", "reviews"]
+BaseViewName = Literal["outline", "entities", "alignments", "reviews"]
 EditKind = Literal["entity_note", "block_text"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Selection:
     """Represents a selected item in a view."""
     kind: Optional[str] = None
     id: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathElement:
     """A single element in the outline navigation path."""
     kind: str  # "work", "document", "section", "block"
@@ -39,7 +40,7 @@ class PathElement:
     title: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EditTarget:
     """Identifies what is being edited."""
     kind: EditKind
@@ -59,16 +60,17 @@ class EditSession:
 # View Data (populated by queries.py, consumed by views)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutlineItem:
     """A single item in the outline list (document, section, or block)."""
     id: str
     kind: str  # "document", "section", "block"
     title: str
     language: str = ""  # Only for blocks
+    children: int = 0  # Sections of a document, blocks of a section
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityItem:
     """A single entity in the entities list."""
     id: str
@@ -76,7 +78,7 @@ class EntityItem:
     label: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlignmentItem:
     """A single alignment in the alignments list."""
     id: str
@@ -87,7 +89,7 @@ class AlignmentItem:
     alignment_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewItem:
     """A single review in the reviews list."""
     id: str
@@ -101,6 +103,10 @@ class ReviewItem:
 # View States
 # =============================================================================
 
+# Blocks are listed a page at a time; scrolling to the end loads the next page
+BLOCK_PAGE_SIZE = 200
+
+
 @dataclass
 class OutlineState:
     """State for outline navigation (documents -> sections -> blocks)."""
@@ -108,6 +114,8 @@ class OutlineState:
     selection: Selection = field(default_factory=Selection)
     items: list[OutlineItem] = field(default_factory=list)
     detail: str = ""
+    block_limit: int = BLOCK_PAGE_SIZE
+    has_more: bool = False
 
 
 @dataclass
@@ -124,6 +132,8 @@ class AlignmentsState:
     selection: Selection = field(default_factory=Selection)
     items: list[AlignmentItem] = field(default_factory=list)
     detail: str = ""
+    # Gap report shown in place of detail until the selection moves
+    gaps: str = ""
 
 
 @dataclass
@@ -134,6 +144,40 @@ class ReviewsState:
     detail: str = ""
 
 
+# Most detail panes kept in LookupCache.details (least recently used go first)
+DETAIL_CACHE_SIZE = 512
+
+
+@dataclass
+class LookupCache:
+    """Rows already read from the DB, reused instead of re-querying.
+
+    Filled by queries.load_* and the edit fetches; app.py drops or
+    rewrites entries on the write paths that change them.
+    """
+    # Everything but section_orders is cleared after every TUI write and
+    # on view switch, which also picks up changes made through the CLI
+    # meanwhile, so an editor never opens on text older than the list.
+    titles: dict[tuple[str, str], str] = field(default_factory=dict)
+    block_texts: dict[str, tuple[str, str]] = field(default_factory=dict)
+    entity_notes: dict[str, tuple[str, str, str]] = field(default_factory=dict)
+    # document id -> highest section order_index (0 if none)
+    section_orders: dict[str, int] = field(default_factory=dict)
+    # (kind, id) -> rendered detail pane, in least-recently-used order
+    details: dict[tuple[str, str], str] = field(default_factory=dict)
+    # List rows per level, e.g. ("sections", document id) -> (items,
+    # has_more)
+    lists: dict[tuple, tuple[list, bool]] = field(default_factory=dict)
+
+    def drop_rendered(self) -> None:
+        """Forget everything read for display, after a write or view switch."""
+        self.titles.clear()
+        self.block_texts.clear()
+        self.entity_notes.clear()
+        self.details.clear()
+        self.lists.clear()
+
+
 @dataclass
 class EditorOverlay:
     """Overlay state for editing (push/pop on top of a base view)."""
@@ -145,98 +189,90 @@ class EditorOverlay:
 # Actions
 # =============================================================================
 
-@dataclass(frozen=True)
-class GotoOutline:
-    """Switch to outline view."""
-    pass
-
-
-@dataclass(frozen=True)
-class GotoEntities:
-    """Switch to entities view."""
-    pass
-
-
-@dataclass(frozen=True)
-class GotoAlignments:
-    """Switch to alignments view."""
-    pass
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlignmentsSelect:
     """Select an alignment."""
     alignment_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlignmentsClearSelection:
     """Clear alignment selection."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClearSelection:
     """Clear selection in current view."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutlineSelect:
     """Select an item in outline view."""
     kind: str
     item_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutlineClearSelection:
     """Clear outline selection."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutlinePush:
     """Push a path element (drill down)."""
     element: PathElement
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutlinePop:
     """Pop the path (go back up)."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class OutlineShowMore:
+    """Load the next page of blocks."""
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class EntitiesSelect:
     """Select an entity."""
     entity_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntitiesClearSelection:
     """Clear entity selection."""
     pass
 
 
-@dataclass(frozen=True)
-class GotoReviews:
-    """Switch to reviews view."""
-    pass
+@dataclass(frozen=True, slots=True)
+class GotoView:
+    """Switch to a base view, closing any editor and its undo history."""
+    view: BaseViewName
+
+    def __post_init__(self) -> None:
+        if self.view not in get_args(BaseViewName):
+            raise ValueError(f"Not a base view: {self.view!r}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewsSelect:
     """Select a review."""
     review_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewsClearSelection:
     """Clear review selection."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartEdit:
     """Start editing (opens editor overlay)."""
     target: EditTarget
@@ -244,23 +280,29 @@ class StartEdit:
     return_to: ViewName
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExitEditor:
     """Exit editor overlay."""
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class SaveAndExit:
+    """Record a saved edit for undo and exit the editor overlay."""
+    target: EditTarget
+    old_text: str
+    new_text: str
+
+
 # Action union type for type checking
 Action = Union[
-    GotoOutline,
-    GotoEntities,
-    GotoAlignments,
-    GotoReviews,
+    GotoView,
     ClearSelection,
     OutlineSelect,
     OutlineClearSelection,
     OutlinePush,
     OutlinePop,
+    OutlineShowMore,
     EntitiesSelect,
     EntitiesClearSelection,
     AlignmentsSelect,
@@ -269,6 +311,7 @@ Action = Union[
     ReviewsClearSelection,
     StartEdit,
     ExitEditor,
+    SaveAndExit,
 ]
 
 
@@ -284,21 +327,13 @@ def reduce(state: "AppState", action: Action) -> None:
     The function mutates state in place (Textual works better with mutable state).
     """
     match action:
-        case GotoOutline():
-            state.view = "outline"
-            state.active_base = "outline"
-
-        case GotoEntities():
-            state.view = "entities"
-            state.active_base = "entities"
-
-        case GotoAlignments():
-            state.view = "alignments"
-            state.active_base = "alignments"
-
-        case GotoReviews():
-            state.view = "reviews"
-            state.active_base = "reviews"
+        case GotoView(view=view):
+            state.cache.drop_rendered()
+            state.editor = None
+            state.undo_redo.clear()
+            state.view = view
+            state.active_base = view
+            state.alignments.gaps = ""
 
         case ClearSelection():
             if state.view == "outline":
@@ -319,11 +354,17 @@ def reduce(state: "AppState", action: Action) -> None:
         case OutlinePush(element=element):
             state.outline.path.append(element)
             state.outline.selection = Selection()
+            state.outline.block_limit = BLOCK_PAGE_SIZE
 
         case OutlinePop():
             if state.outline.path:
                 state.outline.path.pop()
                 state.outline.selection = Selection()
+                state.outline.block_limit = BLOCK_PAGE_SIZE
+
+        case OutlineShowMore():
+            if state.outline.has_more:
+                state.outline.block_limit += BLOCK_PAGE_SIZE
 
         case EntitiesSelect(entity_id=entity_id):
             state.entities.selection = Selection(kind="entity", id=entity_id)
@@ -332,10 +373,14 @@ def reduce(state: "AppState", action: Action) -> None:
             state.entities.selection = Selection()
 
         case AlignmentsSelect(alignment_id=alignment_id):
-            state.alignments.selection = Selection(kind="alignment", id=alignment_id)
+            selection = Selection(kind="alignment", id=alignment_id)
+            if selection != state.alignments.selection:
+                state.alignments.selection = selection
+                state.alignments.gaps = ""
 
         case AlignmentsClearSelection():
             state.alignments.selection = Selection()
+            state.alignments.gaps = ""
 
         case ReviewsSelect(review_id=review_id):
             state.reviews.selection = Selection(kind="review", id=review_id)
@@ -354,10 +399,18 @@ def reduce(state: "AppState", action: Action) -> None:
             state.view = "editor"
 
         case ExitEditor():
-            if state.editor is not None:
-                return_to = state.editor.return_to
-                state.editor = None
-                state.view = return_to
+            _close_editor(state)
+
+        case SaveAndExit(target=target, old_text=old_text, new_text=new_text):
+            state.undo_redo.record(target, old_text, new_text)
+            _close_editor(state)
+
+
+def _close_editor(state: "AppState") -> None:
+    if state.editor is not None:
+        return_to = state.editor.return_to
+        state.editor = None
+        state.view = return_to
 
 
 # =============================================================================
@@ -396,9 +449,17 @@ class AppState:
     # Work context (loaded from config.yml)
     work: Optional[dict[str, Any]] = None
 
-    # Database connection (managed by app lifecycle)
+    # Cached work["work"]["id"], set once when the work is loaded
+    work_id: Optional[str] = None
+
+    # Database connection pool (managed by app lifecycle). DB calls run on
+    # worker threads, so each borrows its own connection and cursor rather
+    # than sharing one long-lived cursor here.
     db: Any = None
 
+    # Titles/texts seen in list queries (see LookupCache)
+    cache: LookupCache = field(default_factory=LookupCache)
+
     # -------------------------------------------------------------------------
     # Dispatch
     # -------------------------------------------------------------------------
@@ -435,6 +496,18 @@ class AppState:
             return self.outline.selection
         return self.outline.selection
 
+    @property
+    def view_selection(self) -> Selection:
+        """Selection of whichever list is on screen.
+
+        Unlike entity_selection, alignments and reviews have their own.
+        """
+        if self.view == "alignments":
+            return self.alignments.selection
+        if self.view == "reviews":
+            return self.reviews.selection
+        return self.entity_selection
+
     @property
     def nav_level(self) -> str:
         """
@@ -2,15 +2,22 @@
 
 This stores edits at the TUI level, not the database layer.
 
-- Each edit holds: target, kind, old, new
+- Each edit holds: target and the changed span (start, old, new);
+  the text around it is not stored, so a keystroke in a long block
+  costs a few characters, not two copies of the block
+- Typing or deleting in one run (pauses under MERGE_WINDOW) is merged
+  into a single edit, so undo steps back a word at a time, not a key
+- History is capped at MAX_HISTORY edits; the oldest are dropped
 - Redo stack only grows while performing undo
 - Stacks are cleared when a view exits or mode changes
 """
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import NamedTuple, Literal, Optional, List
+import time
+from typing import NamedTuple, Literal, Optional, Deque, List
 
 
 EditKind = Literal[
@@ -20,24 +27,83 @@ EditKind = Literal[
 
 EditTarget = NamedTuple("EditTarget", [("kind", EditKind), ("id", str)])
 
+# Undo steps kept (after merging runs of typing)
+MAX_HISTORY = 1000
+
+# Seconds between keystrokes that still continue the same run
+MERGE_WINDOW = 0.5
+
 
 @dataclass(frozen=True)
 class Edit:
+    """Replacement of `old` by `new` at offset `start` of the text."""
     target: EditTarget
+    start: int
     old: str
     new: str
 
+    def undo(self, text: str) -> str:
+        """The text before this edit, given the text after it."""
+        return text[: self.start] + self.old + text[self.start + len(self.new):]
+
+    def redo(self, text: str) -> str:
+        """The text after this edit, given the text before it."""
+        return text[: self.start] + self.new + text[self.start + len(self.old):]
+
+
+def _merge(last: Edit, edit: Edit) -> Optional[Edit]:
+    """One edit doing last then edit, if edit continues a typing run.
+
+    Runs are insertions right after the previous one, or deletions
+    (backspace) right before it; anything else starts a new edit.
+    """
+    if last.target != edit.target:
+        return None
+    if not edit.old and edit.start == last.start + len(last.new):
+        return Edit(last.target, last.start, last.old, last.new + edit.new)
+    if not edit.new and not last.new and edit.start + len(edit.old) == last.start:
+        return Edit(last.target, edit.start, edit.old + last.old, "")
+    return None
+
+
+def _diff(target: EditTarget, old: str, new: str) -> Edit:
+    """Edit covering only the span where old and new differ."""
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    return Edit(
+        target=target,
+        start=start,
+        old=old[start:len(old) - end],
+        new=new[start:len(new) - end],
+    )
+
 
 class UndoRedo:
     """Minimal undo/redo stack for TUI edits."""
 
     def __init__(self) -> None:
-        self._undo: List[Edit] = []
+        # The oldest edits fall off once MAX_HISTORY is reached
+        self._undo: Deque[Edit] = deque(maxlen=MAX_HISTORY)
         self._redo: List[Edit] = []
+        self._last_record = 0.0
 
     def record(self, target: EditTarget, old: str, new: str) -> None:
-        """Record an edit and clear redo history."""
-        self._undo.append(Edit(target=target, old=old, new=new))
+        """Record the change from old to new text and clear redo history."""
+        edit = _diff(target, old, new)
+        now = time.monotonic()
+        merged = None
+        if self._undo and not self._redo and now - self._last_record < MERGE_WINDOW:
+            merged = _merge(self._undo[-1], edit)
+        self._last_record = now
+        if merged is not None:
+            self._undo[-1] = merged
+        else:
+            self._undo.append(edit)
         self._redo.clear()
 
     def can_undo(self) -> bool:
@@ -52,6 +118,7 @@ class UndoRedo:
             return None
         edit = self._undo.pop()
         self._redo.append(edit)
+        self._last_record = 0.0
         return edit
 
     def pop_redo(self) -> Optional[Edit]:
@@ -60,12 +127,14 @@ class UndoRedo:
             return None
         edit = self._redo.pop()
         self._undo.append(edit)
+        self._last_record = 0.0
         return edit
 
     def clear(self) -> None:
         """Clear all history (called on mode/view change)."""
         self._undo.clear()
         self._redo.clear()
+        self._last_record = 0.0
 
     def __len__(self) -> int:
         """Number of undoable edits."""
@@ -1,19 +1,18 @@
 from textual.containers import Horizontal, Vertical
-from textual.widgets import ListItem, ListView, Static
+from textual.widgets import ListItem, Static
 
 from littera.tui.state import AppState
-from littera.tui.views.base import View
+from littera.tui.views.base import NavList, View, selected_index, update_list_layout
 
 
 class AlignmentsView(View):
     name = "alignments"
 
-    def render(self, state: AppState):
-        """Pure render from state.alignments.items and state.alignments.detail."""
-        hints = "d:delete  g:gaps  o:outline  e:entities  Esc:back"
+    HINTS = "d:delete  g:gaps  o:outline  e:entities  Esc:back"
 
+    def _list_items(self, state: AppState, start: int = 0) -> list[ListItem]:
         items = []
-        for alignment_item in state.alignments.items:
+        for alignment_item in state.alignments.items[start:]:
             display = (
                 f"({alignment_item.source_lang}) {alignment_item.source_preview} "
                 f"<-> ({alignment_item.target_lang}) {alignment_item.target_preview} "
@@ -25,17 +24,47 @@ class AlignmentsView(View):
                     id=f"aln-{alignment_item.id}",
                 )
             )
+        return items
+
+    def _selected_widget_id(self, state: AppState) -> str | None:
+        sel = state.alignments.selection
+        return f"aln-{sel.id}" if sel.kind == "alignment" and sel.id else None
 
-        detail = state.alignments.detail or "Select an alignment"
+    def _detail(self, state: AppState) -> str:
+        return state.alignments.gaps or state.alignments.detail or "Select an alignment"
+
+    def render(self, state: AppState):
+        """Pure render from state.alignments.items and detail (or gaps)."""
+        items = self._list_items(state)
+        detail = self._detail(state)
+        index = selected_index(items, self._selected_widget_id(state))
 
         return [
             Vertical(
                 Static("Alignments", id="breadcrumb"),
                 Horizontal(
-                    ListView(*items, id="nav"),
+                    NavList(
+                        *items,
+                        rows=tuple(state.alignments.items),
+                        id="nav",
+                        initial_index=index,
+                    ),
                     Static(detail, id="detail"),
                     id="alignments-layout",
                 ),
-                Static(hints, id="hint-bar"),
+                Static(self.HINTS, id="hint-bar"),
             )
         ]
+
+    async def update(self, state: AppState, root) -> bool:
+        """Patch the mounted alignments layout instead of rebuilding it."""
+        await update_list_layout(
+            root,
+            breadcrumb="Alignments",
+            rows=tuple(state.alignments.items),
+            build_items=lambda start: self._list_items(state, start),
+            detail=self._detail(state),
+            hints=self.HINTS,
+            selected=self._selected_widget_id(state),
+        )
+        return True
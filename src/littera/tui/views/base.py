@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Callable, Iterable, Sequence
 from textual.widget import Widget
+from textual.widgets import ListItem, ListView, Static
 from littera.tui.state import AppState
 
 
@@ -10,6 +11,13 @@ class View(ABC):
     @abstractmethod
     def render(self, state: AppState) -> Iterable[Widget]: ...
 
+    async def update(self, state: AppState, root: Widget) -> bool:
+        """Update the widgets mounted from a previous render() in place.
+
+        Returns False if the view cannot be patched and must be re-rendered.
+        """
+        return False
+
     def handle_key(self, key: str, state: AppState) -> bool:
         return False
 
@@ -18,3 +26,62 @@ class View(ABC):
 
     def exit(self, state: AppState) -> None:
         pass
+
+
+class NavList(ListView):
+    """The nav ListView, remembering the rows it was built from."""
+
+    def __init__(self, *items: ListItem, rows: tuple = (), **kwargs) -> None:
+        super().__init__(*items, **kwargs)
+        self.rows = rows
+
+
+def selected_index(items: Sequence[Widget], widget_id: str | None) -> int:
+    """Position of the item with the given id, or 0 if it is not listed."""
+    if widget_id is not None:
+        for i, item in enumerate(items):
+            if item.id == widget_id:
+                return i
+    return 0
+
+
+def update_static(root: Widget, selector: str, text: str) -> None:
+    """Set a Static's text, skipping the refresh when it is unchanged."""
+    static = root.query_one(selector, Static)
+    if static.content != text:
+        static.update(text)
+
+
+async def update_list_layout(
+    root: Widget,
+    *,
+    breadcrumb: str,
+    rows: tuple,
+    build_items: Callable[[int], list[ListItem]],
+    detail: str,
+    hints: str,
+    selected: str | None,
+) -> None:
+    """Patch a mounted breadcrumb / nav list / detail / hint-bar layout.
+
+    The list is only rebuilt when its rows changed; a selection change
+    just moves the index, and rows added at the end (the next page of a
+    long list) are appended. build_items(start) builds items from
+    rows[start:]. Text panes are only refreshed when their text changed.
+    """
+    update_static(root, "#breadcrumb", breadcrumb)
+    update_static(root, "#detail", detail)
+    update_static(root, "#hint-bar", hints)
+
+    nav = root.query_one("#nav", NavList)
+    if nav.rows != rows:
+        kept = len(nav.rows)
+        if nav.rows and rows[:kept] == nav.rows:
+            await nav.extend(build_items(kept))
+        else:
+            await nav.clear()
+            await nav.extend(build_items(0))
+        nav.rows = rows
+    index = selected_index(nav.children, selected)
+    if nav.index != index:
+        nav.index = index
@@ -1,6 +1,12 @@
 from textual.containers import Vertical
 from textual.widgets import Static
 
+try:
+    from textual.widgets import TextArea
+except ImportError:  # Textual without TextArea: single-line fallback
+    TextArea = None
+    from textual.widgets import Input
+
 from littera.tui.state import AppState
 from littera.tui.views.base import View
 
@@ -23,13 +29,9 @@ class EditorView(View):
                 title = "Editor"
             text = session.current_text
 
-        try:
-            from textual.widgets import TextArea
-
+        if TextArea is not None:
             editor = TextArea(text or "", id="editor")
-        except ImportError:
-            from textual.widgets import Input
-
+        else:
             editor = Input(value=text or "", id="editor")
 
         hints = "Ctrl+S:save  Ctrl+Z:undo  Ctrl+Y:redo  Esc:cancel"
@@ -1,36 +1,62 @@
 from textual.containers import Horizontal, Vertical
-from textual.widgets import ListItem, ListView, Static
+from textual.widgets import ListItem, Static
 
 from littera.tui.state import AppState
-from littera.tui.views.base import View
+from littera.tui.views.base import NavList, View, selected_index, update_list_layout
 
 
 class EntitiesView(View):
     name = "entities"
 
-    def render(self, state: AppState):
-        """Pure render from state.entities.items and state.entities.detail."""
-        hints = "a:add entity  n:edit note  o:outline  Esc:back"
+    HINTS = "a:add entity  n:edit note  o:outline  Esc:back"
 
+    def _list_items(self, state: AppState, start: int = 0) -> list[ListItem]:
         items = []
-        for entity_item in state.entities.items:
+        for entity_item in state.entities.items[start:]:
             items.append(
                 ListItem(
                     Static(f"{entity_item.entity_type}: {entity_item.label}"),
                     id=f"ent-{entity_item.id}",
                 )
             )
+        return items
+
+    def _selected_widget_id(self, state: AppState) -> str | None:
+        sel = state.entities.selection
+        return f"ent-{sel.id}" if sel.kind == "entity" and sel.id else None
 
+    def render(self, state: AppState):
+        """Pure render from state.entities.items and state.entities.detail."""
+        items = self._list_items(state)
         detail = state.entities.detail or "Select an entity"
+        index = selected_index(items, self._selected_widget_id(state))
 
         return [
             Vertical(
                 Static("Entities", id="breadcrumb"),
                 Horizontal(
-                    ListView(*items, id="nav"),
+                    NavList(
+                        *items,
+                        rows=tuple(state.entities.items),
+                        id="nav",
+                        initial_index=index,
+                    ),
                     Static(detail, id="detail"),
                     id="entities-layout",
                 ),
-                Static(hints, id="hint-bar"),
+                Static(self.HINTS, id="hint-bar"),
             )
         ]
+
+    async def update(self, state: AppState, root) -> bool:
+        """Patch the mounted entities layout instead of rebuilding it."""
+        await update_list_layout(
+            root,
+            breadcrumb="Entities",
+            rows=tuple(state.entities.items),
+            build_items=lambda start: self._list_items(state, start),
+            detail=state.entities.detail or "Select an entity",
+            hints=self.HINTS,
+            selected=self._selected_widget_id(state),
+        )
+        return True
@@ -1,16 +1,90 @@
 from textual.containers import Horizontal, Vertical
-from textual.widgets import ListItem, ListView, Static
+from textual.widgets import ListItem, Static
 
 from littera.tui.state import AppState
-from littera.tui.views.base import View
+from littera.tui.views.base import NavList, View, selected_index, update_list_layout
+
+# Muted color for help text (Textual markup)
+HELP_STYLE = "[dim]"
+HELP_END = "[/dim]"
+
+
+def _dim(text: str) -> str:
+    """Mute every non-blank line of a help text."""
+    return "\n".join(
+        f"{HELP_STYLE}{line}{HELP_END}" if line else line for line in text.split("\n")
+    )
 
 
 class OutlineView(View):
     name = "outline"
 
-    # Muted color for help text (Textual markup)
-    HELP_STYLE = "[dim]"
-    HELP_END = "[/dim]"
+    # Widget id prefix and list label per item kind
+    _ID_PREFIX = {"document": "doc", "section": "sec", "block": "blk"}
+    _LABEL = {"document": "DOC", "section": "SEC", "block": "BLK"}
+
+    # Contextual hints per navigation level
+    _HINTS = {
+        "documents": "a:add doc  d:delete  Enter:drill  Esc:back  e:entities",
+        "sections": "a:add sec  d:delete  Enter:drill  Esc:back  Ctrl+E:edit title",
+        "blocks": "a:add blk  d:delete  Enter:edit  l:link entity  Esc:back",
+    }
+    _DEFAULT_HINTS = "a:add  d:delete  Enter:select  Esc:back"
+
+    # Help explaining the mental model, built once at import
+    _MODEL_HELP = {
+        "documents": _dim("""
+─── Littera Structure ───
+
+Work
+  └─ Document    ← you are here
+       └─ Section
+            └─ Block
+
+Documents group sections together.
+Each document is a standalone piece
+— an article, essay, or chapter.
+
+─────────────────────────
+Enter  — drill into document
+a      — add new document
+e      — switch to Entities
+"""),
+        "sections": _dim("""
+─── Littera Structure ───
+
+Work
+  └─ Document
+       └─ Section    ← you are here
+            └─ Block
+
+Sections divide a document.
+Each section is a logical part
+— a subchapter, scene, or argument.
+
+─────────────────────────
+Enter  — drill into section
+Ctrl+E — edit title
+Esc    — back to documents
+"""),
+        "blocks": _dim("""
+─── Littera Structure ───
+
+Work
+  └─ Document
+       └─ Section
+            └─ Block    ← you are here
+
+Blocks are text fragments.
+Each block has a language (en/pl/...)
+and can be linked to an Entity.
+
+─────────────────────────
+Enter  — edit block text
+l      — link to Entity
+Esc    — back to sections
+"""),
+    }
 
     def _build_breadcrumb(self, state: AppState) -> str:
         """Build breadcrumb path string like: Work > Doc > Section"""
@@ -21,119 +95,80 @@ class OutlineView(View):
 
     def _get_hints(self, nav_level: str, has_selection: bool) -> str:
         """Get contextual hints for current navigation level."""
-        base_hints = {
-            "documents": "a:add doc  d:delete  Enter:drill  Esc:back  e:entities",
-            "sections": "a:add sec  d:delete  Enter:drill  Esc:back  Ctrl+E:edit title",
-            "blocks": "a:add blk  d:delete  Enter:edit  l:link entity  Esc:back",
-        }
-        return base_hints.get(nav_level, "a:add  d:delete  Enter:select  Esc:back")
+        return self._HINTS.get(nav_level, self._DEFAULT_HINTS)
 
     def _get_model_help(self, nav_level: str) -> str:
         """Get contextual help explaining the mental model."""
-        h = self.HELP_STYLE
-        e = self.HELP_END
-
-        if nav_level == "documents":
-            return f"""
-{h}─── Littera Structure ───{e}
-
-{h}Work{e}
-{h}  └─ Document    ← you are here{e}
-{h}       └─ Section{e}
-{h}            └─ Block{e}
-
-{h}Documents group sections together.{e}
-{h}Each document is a standalone piece{e}
-{h}— an article, essay, or chapter.{e}
-
-{h}─────────────────────────{e}
-{h}Enter  — drill into document{e}
-{h}a      — add new document{e}
-{h}e      — switch to Entities{e}
-"""
-
-        elif nav_level == "sections":
-            return f"""
-{h}─── Littera Structure ───{e}
-
-{h}Work{e}
-{h}  └─ Document{e}
-{h}       └─ Section    ← you are here{e}
-{h}            └─ Block{e}
-
-{h}Sections divide a document.{e}
-{h}Each section is a logical part{e}
-{h}— a subchapter, scene, or argument.{e}
-
-{h}─────────────────────────{e}
-{h}Enter  — drill into section{e}
-{h}Ctrl+E — edit title{e}
-{h}Esc    — back to documents{e}
-"""
-
-        elif nav_level == "blocks":
-            return f"""
-{h}─── Littera Structure ───{e}
-
-{h}Work{e}
-{h}  └─ Document{e}
-{h}       └─ Section{e}
-{h}            └─ Block    ← you are here{e}
-
-{h}Blocks are text fragments.{e}
-{h}Each block has a language (en/pl/...){e}
-{h}and can be linked to an Entity.{e}
-
-{h}─────────────────────────{e}
-{h}Enter  — edit block text{e}
-{h}l      — link to Entity{e}
-{h}Esc    — back to sections{e}
-"""
-
-        return ""
-
-    def render(self, state: AppState):
-        """Pure render from state.outline.items and state.outline.detail."""
-        nav_level = state.nav_level
-        model_help = self._get_model_help(nav_level)
+        return self._MODEL_HELP.get(nav_level, "")
 
-        # Build list items from pre-loaded state
+    def _list_items(self, state: AppState, start: int = 0) -> list[ListItem]:
+        """Build list items from pre-loaded state."""
         items: list[ListItem] = []
-        prefix_map = {"document": "doc", "section": "sec", "block": "blk"}
-        label_map = {"document": "DOC", "section": "SEC", "block": "BLK"}
-
-        for outline_item in state.outline.items:
-            prefix = prefix_map[outline_item.kind]
-            label = label_map[outline_item.kind]
+        for outline_item in state.outline.items[start:]:
+            prefix = self._ID_PREFIX[outline_item.kind]
+            label = self._LABEL[outline_item.kind]
             if outline_item.kind == "block":
                 display = f"{label}  ({outline_item.language}) {outline_item.title}"
             else:
                 display = f"{label}  {outline_item.title}"
             items.append(ListItem(Static(display), id=f"{prefix}-{outline_item.id}"))
+        return items
+
+    def _detail(self, state: AppState, has_items: bool) -> str:
+        """Use pre-loaded detail, fall back to model help."""
+        nav_level = state.nav_level
+        model_help = self._get_model_help(nav_level)
 
-        # Detail: use pre-loaded detail, fall back to model help
         if state.outline.detail:
-            detail = state.outline.detail
-        elif not items:
+            return state.outline.detail
+        if not has_items:
             if not state.path:
-                detail = f"No documents yet.\nPress 'a' to add one.\n{model_help}"
-            else:
-                last = state.path[-1]
-                detail = f"No {nav_level} in '{last.title}' yet.\nPress 'a' to add one.\n{model_help}"
-        else:
-            detail = model_help
+                return f"No documents yet.\nPress 'a' to add one.\n{model_help}"
+            last = state.path[-1]
+            return f"No {nav_level} in '{last.title}' yet.\nPress 'a' to add one.\n{model_help}"
+        return model_help
+
+    def _selected_widget_id(self, state: AppState) -> str | None:
+        sel = state.outline.selection
+        prefix = self._ID_PREFIX.get(sel.kind or "")
+        if prefix is None or not sel.id:
+            return None
+        return f"{prefix}-{sel.id}"
 
+    def render(self, state: AppState):
+        """Pure render from state.outline.items and state.outline.detail."""
+        items = self._list_items(state)
+        detail = self._detail(state, bool(items))
         breadcrumb = self._build_breadcrumb(state)
         hints = self._get_hints(state.nav_level, bool(state.entity_selection.id))
+        index = selected_index(items, self._selected_widget_id(state))
 
         return [
             Vertical(
                 Static(breadcrumb, id="breadcrumb"),
                 Horizontal(
-                    ListView(*items, id="nav"),
+                    NavList(
+                        *items,
+                        rows=tuple(state.outline.items),
+                        id="nav",
+                        initial_index=index,
+                    ),
                     Static(detail, id="detail"),
                     id="outline-layout",
                 ),
                 Static(hints, id="hint-bar"),
             )
         ]
+
+    async def update(self, state: AppState, root) -> bool:
+        """Patch the mounted outline layout instead of rebuilding it."""
+        await update_list_layout(
+            root,
+            breadcrumb=self._build_breadcrumb(state),
+            rows=tuple(state.outline.items),
+            build_items=lambda start: self._list_items(state, start),
+            detail=self._detail(state, bool(state.outline.items)),
+            hints=self._get_hints(state.nav_level, bool(state.entity_selection.id)),
+            selected=self._selected_widget_id(state),
+        )
+        return True
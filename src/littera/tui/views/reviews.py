@@ -1,8 +1,8 @@
 from textual.containers import Horizontal, Vertical
-from textual.widgets import ListItem, ListView, Static
+from textual.widgets import ListItem, Static
 
 from littera.tui.state import AppState
-from littera.tui.views.base import View
+from littera.tui.views.base import NavList, View, selected_index, update_list_layout
 
 
 # Severity -> Rich markup color
@@ -16,12 +16,11 @@ _SEVERITY_COLOR = {
 class ReviewsView(View):
     name = "reviews"
 
-    def render(self, state: AppState):
-        """Pure render from state.reviews.items and state.reviews.detail."""
-        hints = "a:add review  d:delete  o:outline  e:entities  Esc:back"
+    HINTS = "a:add review  d:delete  o:outline  e:entities  Esc:back"
 
+    def _list_items(self, state: AppState, start: int = 0) -> list[ListItem]:
         items = []
-        for review_item in state.reviews.items:
+        for review_item in state.reviews.items[start:]:
             color = _SEVERITY_COLOR.get(review_item.severity, "yellow")
             scope_part = f" {review_item.scope}:" if review_item.scope else ""
             label = f"[{color}][{review_item.severity}][/{color}]{scope_part} {review_item.description}"
@@ -31,17 +30,44 @@ class ReviewsView(View):
                     id=f"rev-{review_item.id}",
                 )
             )
+        return items
+
+    def _selected_widget_id(self, state: AppState) -> str | None:
+        sel = state.reviews.selection
+        return f"rev-{sel.id}" if sel.kind == "review" and sel.id else None
 
+    def render(self, state: AppState):
+        """Pure render from state.reviews.items and state.reviews.detail."""
+        items = self._list_items(state)
         detail = state.reviews.detail or "Select a review"
+        index = selected_index(items, self._selected_widget_id(state))
 
         return [
             Vertical(
                 Static("Reviews", id="breadcrumb"),
                 Horizontal(
-                    ListView(*items, id="nav"),
+                    NavList(
+                        *items,
+                        rows=tuple(state.reviews.items),
+                        id="nav",
+                        initial_index=index,
+                    ),
                     Static(detail, id="detail"),
                     id="reviews-layout",
                 ),
-                Static(hints, id="hint-bar"),
+                Static(self.HINTS, id="hint-bar"),
             )
         ]
+
+    async def update(self, state: AppState, root) -> bool:
+        """Patch the mounted reviews layout instead of rebuilding it."""
+        await update_list_layout(
+            root,
+            breadcrumb="Reviews",
+            rows=tuple(state.reviews.items),
+            build_items=lambda start: self._list_items(state, start),
+            detail=state.reviews.detail or "Select a review",
+            hints=self.HINTS,
+            selected=self._selected_widget_id(state),
+        )
+        return True
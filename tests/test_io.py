@@ -0,0 +1,88 @@
+"""Tests for JSON import/export (littera import json / export json).
+
+Uses real embedded Postgres per MANIFESTO.
+"""
+
+import json
+import uuid
+
+from tests.test_invariants import init_work, run
+
+
+def test_import_json_bulk_rows(tmp_path):
+    """Blocks and mentions survive import; colliding block ids get fresh ones."""
+    doc_id, sec_id, blk_id, ent_id = (str(uuid.uuid4()) for _ in range(4))
+    data = {
+        "littera_version": "1.0",
+        "work": {
+            "documents": [
+                {
+                    "id": doc_id,
+                    "title": "Imported",
+                    "sections": [
+                        {
+                            "id": sec_id,
+                            "title": "Part",
+                            "order_index": 1,
+                            "blocks": [
+                                # Same id twice in one file, spelled differently:
+                                # the second gets a new one
+                                {"id": blk_id, "language": "en", "source_text": "A cat\tsat"},
+                                {
+                                    "id": blk_id.upper(),
+                                    "language": "pl",
+                                    "source_text": "Kot\\siedział",
+                                },
+                            ],
+                        }
+                    ],
+                }
+            ],
+            "entities": [
+                {"id": ent_id, "entity_type": "concept", "canonical_label": "Cat", "labels": []}
+            ],
+            "mentions": [
+                {
+                    "block_id": blk_id.upper(),
+                    "entity_id": ent_id,
+                    "language": "pl",
+                    "surface_form": "kota",
+                    "features": {"case": "acc"},
+                }
+            ],
+        },
+    }
+    src = tmp_path / "in.json"
+    src.write_text(json.dumps(data), encoding="utf-8")
+
+    with init_work(tmp_path) as workdir:
+        # Second import collides with every id from the first
+        for _ in range(2):
+            res = run(f"littera import json {src}", cwd=workdir)
+            assert res.returncode == 0, res.stdout + res.stderr
+            assert "2 blocks" in res.stdout
+
+        out = tmp_path / "out.json"
+        res = run(f"littera export json -o {out}", cwd=workdir)
+        assert res.returncode == 0, res.stdout + res.stderr
+        work = json.loads(out.read_text(encoding="utf-8"))["work"]
+
+    blocks = [
+        blk
+        for doc in work["documents"]
+        for sec in doc["sections"]
+        for blk in sec["blocks"]
+    ]
+    assert len(blocks) == 4
+    assert len({blk["id"] for blk in blocks}) == 4
+    assert [blk["id"] for blk in blocks].count(blk_id) == 1
+    assert sorted(blk["source_text"] for blk in blocks) == [
+        "A cat\tsat", "A cat\tsat", "Kot\\siedział", "Kot\\siedział",
+    ]
+
+    pl_ids = {blk["id"] for blk in blocks if blk["language"] == "pl"}
+    assert len(work["mentions"]) == 2
+    for mention in work["mentions"]:
+        assert mention["block_id"] in pl_ids
+        assert mention["features"] == {"case": "acc"}
+        assert mention["surface_form"] == "kota"
@@ -135,6 +135,43 @@ def test_undo_redo_flow(tmp_path: Path) -> None:
     assert undo.pop_redo() is not None
 
 
+def test_undo_redo_keeps_changed_span_only() -> None:
+    from littera.tui.undo import MAX_HISTORY, UndoRedo, EditTarget
+
+    undo = UndoRedo()
+    target = EditTarget(kind="block_text", id=str(uuid.uuid4()))
+    before = "x" * 10_000 + "cat" + "y" * 10_000
+    after = "x" * 10_000 + "cats" + "y" * 10_000
+
+    undo.record(target, before, after)
+    edit = undo.pop_undo()
+    assert (edit.old, edit.new) == ("", "s")
+    assert edit.undo(after) == before
+    assert edit.redo(before) == after
+
+    for i in range(MAX_HISTORY + 5):
+        undo.record(target, str(i), str(i + 1))
+    assert len(undo) == MAX_HISTORY
+    assert not undo.can_redo()
+
+
+def test_undo_merges_typing_runs() -> None:
+    from littera.tui.undo import UndoRedo, EditTarget
+
+    undo = UndoRedo()
+    target = EditTarget(kind="block_text", id=str(uuid.uuid4()))
+    texts = ["cat", "cats", "cats!", "cats", "cat", "dog"]
+    for old, new in zip(texts, texts[1:]):
+        undo.record(target, old, new)
+
+    # typing "s!", deleting it again, then the replacement
+    assert len(undo) == 3
+    text = texts[-1]
+    for expected in ("cat", "cats!", "cat"):
+        text = undo.pop_undo().undo(text)
+        assert text == expected
+
+
 if __name__ == "__main__":
     import tempfile
 
@@ -12,6 +12,7 @@ import subprocess
 from pathlib import Path
 
 import psycopg
+from psycopg_pool import ConnectionPool
 import pytest
 import yaml
 
@@ -83,16 +84,22 @@ def tui_state(seeded_work):
     """Per-test: fresh AppState connected to seeded DB."""
     workdir, cfg, pg_cfg = seeded_work
 
-    conn = psycopg.connect(dbname=pg_cfg.db_name, port=pg_cfg.port)
+    pool = ConnectionPool(
+        kwargs={"dbname": pg_cfg.db_name, "port": pg_cfg.port},
+        min_size=1,
+        max_size=2,
+        open=True,
+    )
 
     state = AppState()
-    state.db = conn
+    state.db = pool
     state.work = cfg
+    state.work_id = cfg["work"]["id"]
 
     try:
         yield state
     finally:
-        conn.close()
+        pool.close()
 
 
 @pytest.fixture
@@ -0,0 +1,250 @@
+"""
+Tests for TUI DB mutations (actions.py) against real Postgres.
+"""
+
+import uuid
+
+import pytest
+
+from littera.tui import actions
+from littera.tui.queries import (
+    fetch_alignment_gaps,
+    fetch_block_mentions,
+    fetch_block_text,
+    fetch_entity_note,
+    refresh_alignments,
+    refresh_entities,
+    refresh_reviews,
+)
+from littera.tui.state import AlignmentsSelect, EntitiesSelect, GotoView, ReviewsSelect
+
+
+class TestLinkEntity:
+    """link_entity reuses or creates the entity and links it once."""
+
+    def test_link_creates_entity_and_mention_once(self, tui_state, seeded_ids):
+        db = tui_state.db
+        block_id = seeded_ids["blk1_id"]
+        name = f"Linked {uuid.uuid4().hex[:8]}"
+
+        entity_id, created_new = actions.link_entity(db, block_id, name)
+        try:
+            assert created_new
+
+            again_id, created_again = actions.link_entity(db, block_id, name)
+            assert again_id == entity_id
+            assert not created_again
+
+            linked = [m for m in fetch_block_mentions(db, block_id) if m[2] == name]
+            assert len(linked) == 1
+        finally:
+            actions.delete_entity(db, entity_id)
+
+    def test_linked_entity_detail(self, tui_state, seeded_ids):
+        db = tui_state.db
+        name = f"Detailed {uuid.uuid4().hex[:8]}"
+
+        entity_id, _ = actions.link_entity(db, seeded_ids["blk1_id"], name)
+        try:
+            actions.add_entity_label(db, entity_id, "pl", "Szczegół")
+            actions.set_entity_property(db, entity_id, "gender", "m")
+
+            tui_state.dispatch(GotoView("entities"))
+            tui_state.dispatch(EntitiesSelect(entity_id))
+            refresh_entities(tui_state)
+            detail = tui_state.entities.detail
+
+            assert f"Entity: concept {name}" in detail
+            assert "  - pl: Szczegół" in detail
+            assert "  gender: m" in detail
+            assert seeded_ids["doc1_title"] in detail
+        finally:
+            actions.delete_entity(db, entity_id)
+
+    def test_set_surface_form(self, tui_state, seeded_ids):
+        db = tui_state.db
+        block_id = seeded_ids["blk1_id"]
+        name = f"Cat {uuid.uuid4().hex[:8]}"
+
+        entity_id, _ = actions.link_entity(db, block_id, name)
+        try:
+            actions.add_entity_label(db, entity_id, "en", "cat")
+            mention_id = next(m[0] for m in fetch_block_mentions(db, block_id) if m[2] == name)
+
+            result = actions.set_surface_form(db, mention_id, "en", {"number": "pl"})
+            assert result == "cats"
+            stored = next(m for m in fetch_block_mentions(db, block_id) if m[0] == mention_id)
+            assert stored[4] == "cats"
+
+            assert actions.set_surface_form(db, str(uuid.uuid4()), "en", {}) is None
+        finally:
+            actions.delete_entity(db, entity_id)
+
+    def test_link_to_missing_block_creates_nothing(self, tui_state):
+        db = tui_state.db
+        name = f"Orphan {uuid.uuid4().hex[:8]}"
+
+        with pytest.raises(LookupError):
+            actions.link_entity(db, str(uuid.uuid4()), name)
+
+        with db.connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM entities WHERE canonical_label = %s", (name,)
+            ).fetchone()
+        assert row[0] == 0
+
+
+class TestBlockText:
+    """Block text round-trips through save_block_text/fetch_block_text."""
+
+    def test_save_and_fetch_block_text(self, tui_state, seeded_ids):
+        db = tui_state.db
+        block_id = seeded_ids["blk2_id"]
+        original = fetch_block_text(db, block_id)
+
+        text = "Zażółć gęślą jaźń\nsecond line"
+        actions.save_block_text(db, block_id, text)
+        try:
+            assert fetch_block_text(db, block_id) == (original[0], text)
+        finally:
+            actions.save_block_text(db, block_id, original[1])
+
+
+class TestShiftItem:
+    """shift_item moves relative to the committed order."""
+
+    def test_repeated_shifts_stack(self, tui_state):
+        db = tui_state.db
+        doc_id = actions.create_document(db, tui_state.work["work"]["id"], "Shifting")
+        try:
+            a, b, c = (actions.create_section(db, doc_id, t) for t in "abc")
+
+            assert actions.shift_item(db, "section", c, -1)
+            assert actions.shift_item(db, "section", c, -1)
+            assert not actions.shift_item(db, "section", c, -1)
+
+            with db.connection() as conn:
+                rows = conn.execute(
+                    "SELECT id FROM sections WHERE document_id = %s ORDER BY order_index",
+                    (doc_id,),
+                ).fetchall()
+            assert [str(r[0]) for r in rows] == [c, a, b]
+        finally:
+            actions.delete_item(db, "document", doc_id)
+
+
+class TestEntityProperties:
+    """Properties are merged and removed in SQL, one key at a time."""
+
+    def test_set_and_delete_keys(self, tui_state):
+        db = tui_state.db
+        entity_id = actions.create_entity(db, "concept", f"Props {uuid.uuid4().hex[:8]}")
+        try:
+            actions.set_entity_property(db, entity_id, "gender", "f")
+            actions.set_entity_property(db, entity_id, "number", "pl")
+
+            def props():
+                with db.connection() as conn:
+                    return conn.execute(
+                        "SELECT properties FROM entities WHERE id = %s", (entity_id,)
+                    ).fetchone()[0]
+
+            assert props() == {"gender": "f", "number": "pl"}
+
+            assert actions.delete_entity_property(db, entity_id, "gender")
+            assert not actions.delete_entity_property(db, entity_id, "gender")
+            assert props() == {"number": "pl"}
+
+            assert actions.delete_entity_property(db, entity_id, "number")
+            assert props() is None
+        finally:
+            actions.delete_entity(db, entity_id)
+
+
+class TestWorkScoped:
+    """Notes and reviews are read and written under state.work_id."""
+
+    def test_entity_note_round_trip(self, tui_state, seeded_ids):
+        db = tui_state.db
+        entity_id = seeded_ids["ent2_id"]
+        note = f"Note {uuid.uuid4().hex[:8]}"
+
+        actions.save_entity_note(db, entity_id, tui_state.work_id, note)
+        assert fetch_entity_note(db, entity_id, tui_state.work_id)[2] == note
+
+        tui_state.dispatch(GotoView("entities"))
+        tui_state.dispatch(EntitiesSelect(entity_id))
+        refresh_entities(tui_state)
+        assert note in tui_state.entities.detail
+
+    def test_reviews_listed_for_work(self, tui_state):
+        db = tui_state.db
+        description = f"Review {uuid.uuid4().hex[:8]}"
+
+        review_id = actions.create_review(db, tui_state.work_id, description)
+        try:
+            tui_state.dispatch(GotoView("reviews"))
+            refresh_reviews(tui_state)
+            assert review_id in [r.id for r in tui_state.reviews.items]
+
+            # List and detail read together on a fresh cache
+            tui_state.dispatch(ReviewsSelect(review_id))
+            tui_state.cache.drop_rendered()
+            refresh_reviews(tui_state)
+            assert review_id in [r.id for r in tui_state.reviews.items]
+            assert description in tui_state.reviews.detail
+        finally:
+            actions.delete_review(db, review_id)
+
+
+class TestAlignmentGaps:
+    """fetch_alignment_gaps reports mentioned entities lacking a label."""
+
+    def test_gap_listed_until_label_added(self, tui_state):
+        db = tui_state.db
+        doc_id = actions.create_document(db, tui_state.work_id, "Gaps")
+        name = f"Gap {uuid.uuid4().hex[:8]}"
+        entity_id = None
+        try:
+            sec_id = actions.create_section(db, doc_id, "S")
+            en_block = actions.create_block(db, sec_id)
+            pl_block = actions.create_block(db, sec_id)
+            actions.set_block_language(db, pl_block, "pl")
+            entity_id, _ = actions.link_entity(db, en_block, name)
+            actions.add_entity_label(db, entity_id, "en", name)
+            actions.create_alignment(db, en_block, pl_block)
+
+            gaps = fetch_alignment_gaps(db)
+            assert f'concept "{name}" -- no label for pl' in gaps
+
+            actions.add_entity_label(db, entity_id, "pl", name)
+            assert name not in fetch_alignment_gaps(db)
+        finally:
+            actions.delete_item(db, "document", doc_id)
+            if entity_id:
+                actions.delete_entity(db, entity_id)
+
+
+class TestAlignmentList:
+    """refresh_alignments lists alignments with the selected one's detail."""
+
+    def test_list_and_detail(self, tui_state):
+        db = tui_state.db
+        doc_id = actions.create_document(db, tui_state.work_id, "Aligned")
+        try:
+            sec_id = actions.create_section(db, doc_id, "S")
+            en_block = actions.create_block(db, sec_id)
+            pl_block = actions.create_block(db, sec_id)
+            actions.set_block_language(db, pl_block, "pl")
+            alignment_id = actions.create_alignment(db, en_block, pl_block)
+
+            tui_state.dispatch(GotoView("alignments"))
+            tui_state.dispatch(AlignmentsSelect(alignment_id))
+            refresh_alignments(tui_state)
+
+            item = next(a for a in tui_state.alignments.items if a.id == alignment_id)
+            assert (item.source_lang, item.target_lang) == ("en", "pl")
+            assert "Source (en):" in tui_state.alignments.detail
+            assert "Target (pl):" in tui_state.alignments.detail
+        finally:
+            actions.delete_item(db, "document", doc_id)
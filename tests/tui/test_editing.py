@@ -6,8 +6,17 @@ EditorView.render() doesn't query the DB, but we still provide a real
 connection to eliminate all Mock usage per MANIFESTO.
 """
 
+import pytest
+
 from littera.tui.views.editor import EditorView
-from littera.tui.state import EditSession, EditTarget, StartEdit
+from littera.tui.state import (
+    AppState,
+    EditSession,
+    EditTarget,
+    GotoView,
+    SaveAndExit,
+    StartEdit,
+)
 
 
 class TestEditingFunctionality:
@@ -54,3 +63,34 @@ class TestEditingFunctionality:
         result = editor_view.render(tui_state)
         assert len(result) == 1
         assert result[0].id == "editor_layout"
+
+    def test_save_and_exit_records_undo_and_returns(self):
+        """SaveAndExit records the edit and closes the editor in one step."""
+        state = AppState()
+        target = EditTarget(kind="block_text", id="blk1")
+        state.dispatch(StartEdit(target=target, text="old", return_to="outline"))
+        assert state.view == "editor"
+
+        state.dispatch(SaveAndExit(target, "old", "new"))
+        assert state.view == "outline"
+        assert state.edit_session is None
+        edit = state.undo_redo.pop_undo()
+        assert (edit.old, edit.new) == ("old", "new")
+
+    def test_goto_view_closes_editor_and_clears_undo(self):
+        """Switching views drops the editor overlay and its undo history."""
+        state = AppState()
+        target = EditTarget(kind="entity_note", id="ent1")
+        state.dispatch(StartEdit(target=target, text="old", return_to="entities"))
+        state.undo_redo.record(target, "old", "new")
+
+        state.dispatch(GotoView("outline"))
+        assert state.view == "outline"
+        assert state.active_base == "outline"
+        assert state.edit_session is None
+        assert not state.undo_redo.can_undo()
+
+    def test_goto_view_rejects_editor(self):
+        """The editor is an overlay, never a base view."""
+        with pytest.raises(ValueError):
+            GotoView("editor")
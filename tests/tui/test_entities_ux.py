@@ -4,7 +4,7 @@ Test for entities UX functionality from phase1b-tui.md.
 Verifies entities list, detail, and navigation against real Postgres.
 """
 
-from littera.tui.state import EntitiesSelect, GotoEntities
+from littera.tui.state import EntitiesSelect, GotoView
 from littera.tui.views.entities import EntitiesView
 from littera.tui.queries import refresh_entities
 
@@ -14,7 +14,7 @@ class TestEntitiesUX:
 
     def test_entity_list_renders_without_crashing(self, tui_state):
         """Entity list should render without crashing."""
-        tui_state.dispatch(GotoEntities())
+        tui_state.dispatch(GotoView("entities"))
 
         entities_view = EntitiesView()
         refresh_entities(tui_state)
@@ -23,7 +23,7 @@ class TestEntitiesUX:
 
     def test_entity_list_displays_correct_format(self, tui_state):
         """Entity list should display entities in correct format."""
-        tui_state.dispatch(GotoEntities())
+        tui_state.dispatch(GotoView("entities"))
 
         entities_view = EntitiesView()
         refresh_entities(tui_state)
@@ -32,7 +32,7 @@ class TestEntitiesUX:
 
     def test_entity_detail_shows_help_text_when_no_selection(self, tui_state):
         """Entities view should show help text when no entity is selected."""
-        tui_state.dispatch(GotoEntities())
+        tui_state.dispatch(GotoView("entities"))
         assert tui_state.entities.selection.kind is None
 
         entities_view = EntitiesView()
@@ -42,7 +42,7 @@ class TestEntitiesUX:
 
     def test_entities_view_selects_entity_correctly(self, tui_state, seeded_ids):
         """Entities view should select entity correctly."""
-        tui_state.dispatch(GotoEntities())
+        tui_state.dispatch(GotoView("entities"))
         tui_state.dispatch(EntitiesSelect(seeded_ids["ent1_id"]))
 
         assert tui_state.entities.selection.kind == "entity"
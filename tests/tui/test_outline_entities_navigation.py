@@ -4,8 +4,9 @@ Test for navigation between outline and entities views.
 Verifies context preservation between views against real Postgres.
 """
 
-from littera.tui.state import OutlineSelect, GotoOutline
-from littera.tui.state import EntitiesSelect, GotoEntities
+from littera.tui.state import OutlineSelect, GotoView
+from littera.tui.state import EntitiesSelect
+from littera.tui.state import AlignmentsSelect, AppState, ReviewsSelect, Selection
 from littera.tui.views.outline import OutlineView
 from littera.tui.views.entities import EntitiesView
 from littera.tui.queries import refresh_outline, refresh_entities
@@ -16,7 +17,7 @@ class TestOutlineEntitiesNavigation:
 
     def test_navigation_preserves_context(self, tui_state, seeded_ids):
         """Navigation between outline and entities should preserve selection contexts."""
-        tui_state.dispatch(GotoOutline())
+        tui_state.dispatch(GotoView("outline"))
         tui_state.dispatch(
             OutlineSelect(kind="document", item_id=seeded_ids["doc1_id"])
         )
@@ -26,7 +27,7 @@ class TestOutlineEntitiesNavigation:
         assert tui_state.outline.selection.id == seeded_ids["doc1_id"]
         assert tui_state.entities.selection.kind is None
 
-        tui_state.dispatch(GotoEntities())
+        tui_state.dispatch(GotoView("entities"))
 
         assert tui_state.view == "entities"
         assert tui_state.outline.selection.kind == "document"
@@ -37,12 +38,12 @@ class TestOutlineEntitiesNavigation:
         assert tui_state.entities.selection.kind == "entity"
         assert tui_state.entities.selection.id == seeded_ids["ent1_id"]
 
-        tui_state.dispatch(GotoOutline())
+        tui_state.dispatch(GotoView("outline"))
         assert tui_state.view == "outline"
         assert tui_state.outline.selection.kind == "document"
         assert tui_state.outline.selection.id == seeded_ids["doc1_id"]
 
-        tui_state.dispatch(GotoEntities())
+        tui_state.dispatch(GotoView("entities"))
         assert tui_state.view == "entities"
         assert tui_state.entities.selection.kind == "entity"
         assert tui_state.entities.selection.id == seeded_ids["ent1_id"]
@@ -50,14 +51,54 @@ class TestOutlineEntitiesNavigation:
 
     def test_views_render_without_crashing(self, tui_state):
         """Both views should render without crashing regardless of selection state."""
-        tui_state.dispatch(GotoOutline())
+        tui_state.dispatch(GotoView("outline"))
         outline_view = OutlineView()
         refresh_outline(tui_state)
         outline_result = outline_view.render(tui_state)
         assert len(outline_result) == 1
 
-        tui_state.dispatch(GotoEntities())
+        tui_state.dispatch(GotoView("entities"))
         entities_view = EntitiesView()
         refresh_entities(tui_state)
         entities_result = entities_view.render(tui_state)
         assert len(entities_result) == 1
+
+
+class TestViewSelection:
+    """view_selection follows the list that is on screen."""
+
+    def test_each_view_reports_its_own_selection(self):
+        state = AppState()
+        state.dispatch(OutlineSelect(kind="document", item_id="doc1"))
+        assert state.view_selection == Selection(kind="document", id="doc1")
+
+        state.dispatch(GotoView("alignments"))
+        state.dispatch(AlignmentsSelect("aln1"))
+        assert state.view_selection == Selection(kind="alignment", id="aln1")
+
+        state.dispatch(GotoView("reviews"))
+        state.dispatch(ReviewsSelect("rev1"))
+        assert state.view_selection == Selection(kind="review", id="rev1")
+        state.dispatch(ReviewsSelect("rev2"))
+        assert state.view_selection == Selection(kind="review", id="rev2")
+
+        state.dispatch(GotoView("entities"))
+        state.dispatch(EntitiesSelect("ent1"))
+        assert state.view_selection == Selection(kind="entity", id="ent1")
+
+
+class TestAlignmentGapsReport:
+    """The gap report stays up until the alignment selection moves."""
+
+    def test_gaps_cleared_when_selection_moves(self):
+        state = AppState()
+        state.dispatch(GotoView("alignments"))
+        state.dispatch(AlignmentsSelect("aln1"))
+        state.alignments.gaps = "Total gaps: 1"
+
+        # Re-highlighting the same row after a render keeps it
+        state.dispatch(AlignmentsSelect("aln1"))
+        assert state.alignments.gaps == "Total gaps: 1"
+
+        state.dispatch(AlignmentsSelect("aln2"))
+        assert state.alignments.gaps == ""
@@ -11,7 +11,10 @@ from littera.tui.state import (
     OutlinePop,
     OutlineSelect,
     OutlineClearSelection,
+    OutlineShowMore,
+    GotoView,
 )
+from littera.tui import actions, queries
 from littera.tui.queries import refresh_outline
 
 
@@ -210,3 +213,219 @@ class TestHighlightUpdatesDetail:
         state.dispatch(OutlineClearSelection())
         assert state.entity_selection.kind is None
         assert state.entity_selection.id is None
+
+
+class TestLookupCache:
+    """Listed rows are cached so actions don't re-query them."""
+
+    def test_refresh_caches_titles_and_block_texts(self, tui_state, seeded_ids):
+        refresh_outline(tui_state)
+        titles = tui_state.cache.titles
+        assert titles["document", seeded_ids["doc1_id"]] == seeded_ids["doc1_title"]
+
+        tui_state.dispatch(
+            OutlinePush(
+                PathElement(
+                    kind="document",
+                    id=seeded_ids["doc1_id"],
+                    title=seeded_ids["doc1_title"],
+                )
+            )
+        )
+        refresh_outline(tui_state)
+        assert titles["section", seeded_ids["sec1_id"]] == seeded_ids["sec1_title"]
+
+        tui_state.dispatch(
+            OutlinePush(
+                PathElement(
+                    kind="section",
+                    id=seeded_ids["sec1_id"],
+                    title=seeded_ids["sec1_title"],
+                )
+            )
+        )
+        refresh_outline(tui_state)
+        lang, text = tui_state.cache.block_texts[seeded_ids["blk1_id"]]
+        assert lang
+        assert text
+
+    def test_long_blocks_list_a_preview_only(self, tui_state):
+        db = tui_state.db
+        doc_id = actions.create_document(db, tui_state.work_id, "Long")
+        try:
+            sec_id = actions.create_section(db, doc_id, "S")
+            block_id = actions.create_block(db, sec_id)
+            text = "word\n" * 100
+            actions.save_block_text(db, block_id, text)
+
+            for element in (
+                PathElement(kind="document", id=doc_id, title="Long"),
+                PathElement(kind="section", id=sec_id, title="S"),
+            ):
+                tui_state.dispatch(OutlinePush(element))
+            # Cached while the block was still short
+            tui_state.cache.block_texts[block_id] = ("en", "short")
+            refresh_outline(tui_state)
+
+            (item,) = tui_state.outline.items
+            assert item.title == text.replace("\n", " ")[: queries.PREVIEW_LENGTH]
+            assert block_id not in tui_state.cache.block_texts
+            assert queries.fetch_block_text(db, block_id)[1] == text
+        finally:
+            actions.delete_item(db, "document", doc_id)
+
+    def test_lists_reused_until_a_write_drops_them(self, tui_state):
+        db = tui_state.db
+        refresh_outline(tui_state)
+        doc_id = actions.create_document(db, tui_state.work_id, "Cached")
+        try:
+            refresh_outline(tui_state)
+            assert doc_id not in [i.id for i in tui_state.outline.items]
+
+            tui_state.cache.drop_rendered()
+            refresh_outline(tui_state)
+            assert doc_id in [i.id for i in tui_state.outline.items]
+        finally:
+            actions.delete_item(db, "document", doc_id)
+
+    def test_load_is_not_applied_after_navigating_away(self, tui_state, seeded_ids):
+        apply = queries.load_outline(tui_state)
+        tui_state.dispatch(
+            OutlinePush(
+                PathElement(
+                    kind="document",
+                    id=seeded_ids["doc1_id"],
+                    title=seeded_ids["doc1_title"],
+                )
+            )
+        )
+        apply()
+        assert tui_state.outline.items == []
+
+        # The rows read were still cached under the level they came from
+        assert ("documents",) in tui_state.cache.lists
+        assert ("document", seeded_ids["doc1_id"]) not in tui_state.cache.lists
+
+    def test_refresh_caches_highest_section_order(self, tui_state, seeded_ids):
+        tui_state.dispatch(
+            OutlinePush(
+                PathElement(
+                    kind="document",
+                    id=seeded_ids["doc1_id"],
+                    title=seeded_ids["doc1_title"],
+                )
+            )
+        )
+        refresh_outline(tui_state)
+        assert tui_state.cache.section_orders[seeded_ids["doc1_id"]] >= 1
+
+        # An index reserved by an add that hasn't landed yet survives refresh
+        tui_state.cache.section_orders[seeded_ids["doc1_id"]] = 1000
+        refresh_outline(tui_state)
+        assert tui_state.cache.section_orders[seeded_ids["doc1_id"]] == 1000
+
+    def test_refresh_reuses_cached_detail(self, tui_state, seeded_ids):
+        for kind, key in (("document", "doc1"), ("section", "sec1")):
+            tui_state.dispatch(
+                OutlinePush(
+                    PathElement(
+                        kind=kind,
+                        id=seeded_ids[f"{key}_id"],
+                        title=seeded_ids[f"{key}_title"],
+                    )
+                )
+            )
+        block_id = seeded_ids["blk1_id"]
+        tui_state.dispatch(OutlineSelect(kind="block", item_id=block_id))
+        refresh_outline(tui_state)
+        assert tui_state.cache.details["block", block_id] == tui_state.outline.detail
+
+        tui_state.cache.details["block", block_id] = "cached"
+        refresh_outline(tui_state)
+        assert tui_state.outline.detail == "cached"
+
+        tui_state.cache.details.clear()
+        refresh_outline(tui_state)
+        assert tui_state.outline.detail.startswith("Block (")
+
+    def test_listed_rows_carry_container_detail(self, tui_state, seeded_ids):
+        doc_id = seeded_ids["doc1_id"]
+        tui_state.dispatch(OutlineSelect(kind="document", item_id=doc_id))
+        refresh_outline(tui_state)
+        assert seeded_ids["doc1_title"] in tui_state.outline.detail
+        assert "Sections: " in tui_state.outline.detail
+        assert ("document", doc_id) not in tui_state.cache.details
+
+    def test_detail_cache_drops_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(queries, "DETAIL_CACHE_SIZE", 2)
+        state = AppState()
+        queries._cached_detail(state, "document", "a", lambda: "A")
+        queries._cached_detail(state, "document", "b", lambda: "B")
+        assert queries._cached_detail(state, "document", "a", lambda: "miss") == "A"
+
+        queries._cached_detail(state, "document", "c", lambda: "C")
+        assert list(state.cache.details) == [("document", "a"), ("document", "c")]
+
+    def test_view_switch_drops_cached_details(self):
+        state = AppState()
+        state.cache.details["document", "a"] = "A"
+        state.dispatch(GotoView("entities"))
+        assert not state.cache.details
+
+    def test_view_switch_drops_cached_texts(self):
+        state = AppState()
+        state.cache.titles["document", "a"] = "A"
+        state.cache.block_texts["b"] = ("en", "old text")
+        state.cache.entity_notes["e"] = ("person", "E", "old note")
+        state.cache.section_orders["a"] = 3
+        state.dispatch(GotoView("entities"))
+        assert not state.cache.titles
+        assert not state.cache.block_texts
+        assert not state.cache.entity_notes
+        assert state.cache.section_orders == {"a": 3}
+
+
+class TestBlockWindow:
+    """Long sections list their blocks a page at a time."""
+
+    def _enter_section(self, state, seeded_ids):
+        state.dispatch(
+            OutlinePush(
+                PathElement(
+                    kind="document",
+                    id=seeded_ids["doc1_id"],
+                    title=seeded_ids["doc1_title"],
+                )
+            )
+        )
+        state.dispatch(
+            OutlinePush(
+                PathElement(
+                    kind="section",
+                    id=seeded_ids["sec1_id"],
+                    title=seeded_ids["sec1_title"],
+                )
+            )
+        )
+
+    def test_show_more_loads_next_page(self, tui_state, seeded_ids):
+        self._enter_section(tui_state, seeded_ids)
+        tui_state.outline.block_limit = 1
+
+        refresh_outline(tui_state)
+        assert [i.id for i in tui_state.outline.items] == [seeded_ids["blk1_id"]]
+        assert tui_state.outline.has_more
+
+        tui_state.dispatch(OutlineShowMore())
+        refresh_outline(tui_state)
+        ids = [i.id for i in tui_state.outline.items]
+        assert ids[:2] == [seeded_ids["blk1_id"], seeded_ids["blk2_id"]]
+        assert not tui_state.outline.has_more
+
+    def test_window_grows_to_include_selection(self, tui_state, seeded_ids):
+        self._enter_section(tui_state, seeded_ids)
+        tui_state.outline.block_limit = 1
+        tui_state.dispatch(OutlineSelect(kind="block", item_id=seeded_ids["blk2_id"]))
+
+        refresh_outline(tui_state)
+        assert seeded_ids["blk2_id"] in [i.id for i in tui_state.outline.items]